@@ -2,16 +2,61 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import time
 import numpy as np
+import cv2
 from datetime import datetime
 import os
 import json
 from PIL import Image, ImageTk
-import discorpy.post.postprocessing as post
 import imageio
 import threading
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 import signal
 import sys
-from contextlib import contextmanager
+import traceback
+from contextlib import contextmanager, ExitStack
+
+# Optional JIT compilation for the distortion map builder
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+# Optional fast uncompressed TIFF writer (falls back to imageio)
+try:
+    import tifffile
+    TIFFFILE_AVAILABLE = True
+except ImportError:
+    tifffile = None
+    TIFFFILE_AVAILABLE = False
+
+# Optional fast JSON (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Camera library and zero-copy access to its buffers (only present on the Pi)
+try:
+    from picamera2 import MappedArray, Picamera2
+    PICAMERA2_AVAILABLE = True
+except ImportError:
+    MappedArray = None
+    Picamera2 = None
+    PICAMERA2_AVAILABLE = False
+
+# tifffile needs imagecodecs for LZ4 (zlib works without it)
+try:
+    import imagecodecs
+    IMAGECODECS_AVAILABLE = True
+except ImportError:
+    imagecodecs = None
+    IMAGECODECS_AVAILABLE = False
 
 # Ultra-Safe GUI for dual IMX708 camera control - NO PREVIEW VERSION (v1.4)
 # 
@@ -25,6 +70,236 @@ from contextlib import contextmanager
 # - Text-only status updates
 # - Emergency stop mechanisms
 
+
+# OpenCL device for the correction remaps (OpenCV T-API); usually absent on the Pi
+OPENCL_AVAILABLE = cv2.ocl.haveOpenCL()
+
+# Low-resolution ISP stream used for the live preview (main stream size / 4)
+PREVIEW_LORES_SIZE = (1152, 648)
+
+# Lines kept in the log display; older ones are dropped so inserts stay cheap
+LOG_MAX_LINES = 500
+
+# Counter-clockwise right-angle rotations (getRotationMatrix2D convention) done as plain copies
+RIGHT_ANGLE_ROTATIONS = {
+    90: cv2.ROTATE_90_COUNTERCLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_CLOCKWISE,
+}
+
+
+def load_json(path):
+    """Read a JSON file, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def dump_json(obj, path):
+    """Write obj as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # e.g. non-string keys, which the standard library coerces
+            data = None
+        if data is not None:
+            with open(path, 'wb') as f:
+                f.write(data)
+            return
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=4)
+
+
+def yuv420_planes(yuv, width, height):
+    """Return (Y, U, V) plane views of a Picamera2 YUV420 (I420) array, dropping row padding"""
+    stride = yuv.shape[1]
+    y = yuv[:height, :width]
+    u = yuv[height:height + height // 4].reshape(height // 2, stride // 2)[:, :width // 2]
+    v = yuv[height + height // 4:height + height // 2].reshape(height // 2, stride // 2)[:, :width // 2]
+    return y, u, v
+
+
+def yuv420_to_rgb(yuv, width, height):
+    """Convert a Picamera2 YUV420 (I420) array, possibly stride-padded, to RGB"""
+    if yuv.shape[1] != width:
+        # Repack the Y, U and V planes without their row padding
+        yuv = np.concatenate([plane.ravel() for plane in yuv420_planes(yuv, width, height)])
+        yuv = yuv.reshape(height * 3 // 2, width)
+    return cv2.cvtColor(yuv, cv2.COLOR_YUV2RGB_I420)
+
+
+def _build_distortion_map_numpy(height, width, xcenter, ycenter, coeffs, block_rows=256):
+    """Vectorised distortion map builder used when Numba is not installed"""
+    map_x = np.empty((height, width), dtype=np.float32)
+    map_y = np.empty((height, width), dtype=np.float32)
+    xu = np.arange(width, dtype=np.float64) - xcenter
+    # Row blocks keep the float64 temporaries small; results go straight into the float32 maps
+    for start in range(0, height, block_rows):
+        yu = np.arange(start, min(start + block_rows, height), dtype=np.float64)[:, None] - ycenter
+        ru = np.sqrt(xu * xu + yu * yu)
+        fact = np.zeros_like(ru)
+        for k in coeffs[::-1]:
+            fact *= ru
+            fact += k
+        rows = slice(start, start + yu.shape[0])
+        np.clip(xcenter + fact * xu, 0, width - 1, out=map_x[rows], casting='same_kind')
+        np.clip(ycenter + fact * yu, 0, height - 1, out=map_y[rows], casting='same_kind')
+    return map_x, map_y
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _build_distortion_map_jit(height, width, xcenter, ycenter, coeffs):
+        """Compiled distortion map builder (one straight loop per row)"""
+        map_x = np.empty((height, width), dtype=np.float32)
+        map_y = np.empty((height, width), dtype=np.float32)
+        n_coeffs = coeffs.shape[0]
+        for i in numba.prange(height):
+            yu = i - ycenter
+            for j in range(width):
+                xu = j - xcenter
+                ru = np.sqrt(xu * xu + yu * yu)
+                fact = 0.0
+                for k in range(n_coeffs - 1, -1, -1):
+                    fact = fact * ru + coeffs[k]
+                map_x[i, j] = min(max(xcenter + fact * xu, 0.0), width - 1.0)
+                map_y[i, j] = min(max(ycenter + fact * yu, 0.0), height - 1.0)
+        return map_x, map_y
+
+
+def _reflect101(coords, size):
+    """Fold sample coordinates into [0, size - 1] the way cv2.BORDER_REFLECT_101 does"""
+    period = 2 * (size - 1)
+    coords = np.abs(coords) % period
+    return np.where(coords > size - 1, period - coords, coords)
+
+
+def build_fused_rotation_map(height, width, top_padding, bottom_padding, xcenter, ycenter, coeffs, angle,
+                             homography=None, block_rows=256):
+    """Build fixed-point remap tables doing distortion correction and rotation in one pass
+
+    Output pixels are traced back through the rotation (reflect-101 border, as rotate_image),
+    then through the backward perspective homography if one is given (replicated border, as
+    apply_perspective_correction) and finally through the distortion model (as
+    build_distortion_map on the padded frame). map_y points into the unpadded crop, whose
+    zero padding a constant border reproduces.
+    """
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    new_height = height + top_padding + bottom_padding
+    ycenter = ycenter + top_padding
+    inverse = cv2.invertAffineTransform(
+        cv2.getRotationMatrix2D((width // 2, new_height // 2), angle, 1.0))
+
+    map_x = np.empty((new_height, width), dtype=np.float32)
+    map_y = np.empty((new_height, width), dtype=np.float32)
+    xs = np.arange(width, dtype=np.float64)
+    # Row blocks keep the float64 temporaries small on the Pi
+    for start in range(0, new_height, block_rows):
+        ys = np.arange(start, min(start + block_rows, new_height), dtype=np.float64)[:, None]
+        xu = _reflect101(inverse[0, 0] * xs + inverse[0, 1] * ys + inverse[0, 2], width)
+        yu = _reflect101(inverse[1, 0] * xs + inverse[1, 1] * ys + inverse[1, 2], new_height)
+        if homography is not None:
+            w = homography[2, 0] * xu + homography[2, 1] * yu + homography[2, 2]
+            xu, yu = (np.clip((homography[0, 0] * xu + homography[0, 1] * yu + homography[0, 2]) / w, 0, width - 1),
+                      np.clip((homography[1, 0] * xu + homography[1, 1] * yu + homography[1, 2]) / w, 0, new_height - 1))
+        xu -= xcenter
+        yu -= ycenter
+        ru = np.sqrt(xu * xu + yu * yu)
+        fact = np.zeros_like(ru)
+        for k in coeffs[::-1]:
+            fact = fact * ru + k
+        rows = slice(start, start + ys.shape[0])
+        map_x[rows] = np.clip(xcenter + fact * xu, 0, width - 1)
+        map_y[rows] = np.clip(ycenter + fact * yu, 0, new_height - 1) - top_padding
+    return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True)
+    def _raw16_to_rgb8_jit(raw, out, shift):
+        """Bin each RGGB quad of an unpacked raw frame into one 8-bit RGB pixel"""
+        height, width = out.shape[0], out.shape[1]
+        for y in numba.prange(height):
+            for x in range(width):
+                r = raw[2 * y, 2 * x] >> shift
+                g = ((np.uint32(raw[2 * y, 2 * x + 1]) + raw[2 * y + 1, 2 * x]) >> 1) >> shift
+                b = raw[2 * y + 1, 2 * x + 1] >> shift
+                out[y, x, 0] = min(r, 255)
+                out[y, x, 1] = min(g, 255)
+                out[y, x, 2] = min(b, 255)
+
+
+def raw16_to_rgb8(raw, out=None, bit_depth=10):
+    """Convert an unpacked RGGB Bayer uint16 frame to half-resolution 8-bit RGB"""
+    height, width = raw.shape[0] // 2, raw.shape[1] // 2
+    if out is None or out.shape != (height, width, 3):
+        out = np.empty((height, width, 3), dtype=np.uint8)
+    shift = bit_depth - 8
+    if NUMBA_AVAILABLE:
+        _raw16_to_rgb8_jit(raw, out, shift)
+    else:
+        raw = raw[:2 * height, :2 * width]
+        green = (raw[0::2, 1::2].astype(np.uint32) + raw[1::2, 0::2]) >> 1
+        np.minimum(raw[0::2, 0::2] >> shift, 255, out=out[..., 0], casting='unsafe')
+        np.minimum(green >> shift, 255, out=out[..., 1], casting='unsafe')
+        np.minimum(raw[1::2, 1::2] >> shift, 255, out=out[..., 2], casting='unsafe')
+    return out
+
+
+def build_distortion_map(height, width, xcenter, ycenter, coeffs):
+    """Build the backward sampling map (map_x, map_y) used by discorpy's unwarp_image_backward"""
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _build_distortion_map_jit(int(height), int(width), float(xcenter), float(ycenter), coeffs)
+    return _build_distortion_map_numpy(height, width, xcenter, ycenter, coeffs)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _array_range_jit(rows):
+        """Minimum and maximum of a 2-D array in a single sweep"""
+        lo = rows[0, 0]
+        hi = lo
+        for i in range(rows.shape[0]):
+            row = rows[i]
+            for j in range(row.shape[0]):
+                value = row[j]
+                if value < lo:
+                    lo = value
+                if value > hi:
+                    hi = value
+        return lo, hi
+
+
+def array_range(array):
+    """Return (min, max) of an image, reading it once when Numba is available"""
+    if NUMBA_AVAILABLE and array.size and array.ndim >= 2 and array.dtype.kind in 'ui':
+        # Rows of camera buffers are contiguous even when padded, so this stays a view
+        return _array_range_jit(array.reshape(array.shape[0], -1))
+    return array.min(), array.max()
+
+
+def warm_jit_kernels():
+    """Compile (or load from Numba's cache) the JIT kernels on tiny inputs
+
+    Run in the background at startup so the first correction or raw preview does not
+    pay for compilation, even when distortion correction starts out disabled.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    build_distortion_map(4, 4, 1.5, 1.5, [1.0, 0.0])
+    raw16_to_rgb8(np.zeros((4, 4), dtype=np.uint16))
+    for dtype in (np.uint8, np.uint16):
+        array_range(np.zeros((2, 2), dtype=dtype))
+
+
+class CameraTimeoutError(Exception):
+    """Raised on the main thread when a guarded camera operation overruns its timeout"""
+
+
 class UltraSafeIMX708Viewer:
     def __init__(self):
         # Safety flags
@@ -32,7 +307,19 @@ class UltraSafeIMX708Viewer:
         self.cameras_initializing = False
         self.operation_in_progress = False
         self.preview_running = False
-        self.preview_thread = None
+        self.preview_after_id = None
+        # Pending debounced apply_settings() call (slider drags fire many changes)
+        self.apply_after_id = None
+        # Controls last sent to the cameras; cleared whenever the cameras are (re)initialised
+        self.last_applied_settings = None
+        # Single-slot handoff of the newest rendered preview frame to the Tk thread
+        self._pending_frame = None
+        self._pending_lock = threading.Lock()
+        self.preview_capture_busy = False
+        # Target rate, parsed from the FPS box only when it changes
+        self.preview_fps_target = 2.0
+        # Display times of the last 10 preview frames, for the measured FPS
+        self.preview_frame_times = deque(maxlen=10)
         
         # Camera connection status
         self.cam0_connected = False
@@ -42,6 +329,26 @@ class UltraSafeIMX708Viewer:
         
         # Initialize camera configuration template
         self.camera_config = None
+        # Picamera2 "BGR888" arrays are already R,G,B in memory; only "RGB888" needs a swap
+        self.preview_swap_rb = False
+        # Luma-only preview, mirrored from the checkbox so preview workers never touch Tk
+        self.preview_grayscale = False
+        self._gray_buf = None
+        # 8-bit display buffer for previews of 16-bit frames
+        self._preview_u8_buf = None
+        # Display-sized I420 scratch buffers for planar lores previews, keyed by (width, height)
+        self._i420_buf = {}
+        # Stream used for the live preview and its scale relative to the main stream
+        self.preview_stream = "main"
+        self.preview_stream_size = None
+        self.preview_crop_scale = 1.0
+        # (key, plan) for the current preview layout: crop heights, display sizes and the
+        # reused side-by-side buffer with its per-camera views
+        self._preview_plan = None
+        self.preview_photo = None
+        self.preview_items = None
+        # Half-resolution RGB buffers for raw (Bayer uint16) preview frames
+        self._raw_rgb_buf = {}
 
         # Autofocus support tracking
         self.focus_supported = {"cam0": False, "cam1": False}
@@ -85,6 +392,51 @@ class UltraSafeIMX708Viewer:
         self.right_top_padding = 200
         self.right_bottom_padding = 50
 
+        # Cached distortion sampling maps per camera, keyed by shape and coefficients
+        self._distortion_maps = {}
+        # Reusable perspective correction output buffers per camera
+        self._persp_out = {}
+        # Reusable distortion correction output buffers per camera
+        self._out_buf = {}
+        # Cached fixed-point rotation remap tables per camera, keyed by angle and shape
+        self._rotation_maps = {}
+        # Cached fused distortion+rotation remap tables per camera (used without perspective)
+        self._fused_maps = {}
+        # Remaps run on the OpenCL device when one is present; tables are uploaded once
+        self.use_opencl = OPENCL_AVAILABLE
+        self._umat_maps = {}
+        # (settings signature, text) of the last processing info report
+        self._info_cache = None
+        # Side-by-side output buffer, reused once the TIFF writer no longer holds it
+        self._combined_buf = None
+        # Deadlines of camera_timeout blocks on worker threads: ident -> [deadline, timeout, reported]
+        self._watched_operations = {}
+        self._watch_lock = threading.Lock()
+        threading.Thread(target=self._camera_watchdog_loop, daemon=True).start()
+        # Precomputed crop slices, refreshed whenever crop settings change
+        self.update_crop_slices()
+
+        # Background writers for DNG files (one per camera)
+        self.io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dng_writer")
+        # DNG writes submitted to io_executor and not yet finished
+        self._dng_inflight = 0
+        self._dng_lock = threading.Lock()
+
+        # Processed TIFFs are encoded and written by a single background writer
+        self.tiff_queue = queue.Queue(maxsize=8)
+        # Multi-page file that burst-mode saves append to (None when not bursting)
+        self.burst_path = None
+        threading.Thread(target=self._tiff_writer_loop, daemon=True).start()
+
+        # Per-camera processing pipelines run side by side (numpy/cv2 release the GIL)
+        self.process_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image_process")
+
+        # Blocking preview captures run here; display stays on the Tk main loop.
+        # One capture cycle is in flight at a time; cam1 waits on its own worker alongside it,
+        # so a cycle never blocks on a task queued behind itself in the same pool.
+        self.preview_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview_capture")
+        self.preview_cam1_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview_cam1")
+
         # Default/base values
         self.defaults = {
             'ExposureTime': 10000,
@@ -119,6 +471,8 @@ class UltraSafeIMX708Viewer:
             'Saturation': {'value': self.defaults['Saturation'], 'min': 0.0, 'max': 4.0},
             'Sharpness': {'value': self.defaults['Sharpness'], 'min': 0.0, 'max': 4.0}
         }
+        # Filename suffix built from the parameters, refreshed whenever they change
+        self.update_params_str()
 
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -130,7 +484,12 @@ class UltraSafeIMX708Viewer:
         # Load settings (non-blocking)
         self.load_settings()
         self.load_distortion_coefficients()
-        
+        if self.use_opencl:
+            self.log_message(f"⚡ OpenCL remaps enabled ({cv2.ocl.Device.getDefault().name()})")
+
+        # Build distortion maps for the known crop sizes in the background
+        threading.Thread(target=self.prepare_distortion_maps, daemon=True).start()
+
         # Save current configuration to today's folder
         self.save_all_to_day_folder()
 
@@ -143,27 +502,50 @@ class UltraSafeIMX708Viewer:
 
     @contextmanager
     def camera_timeout(self, timeout_seconds=5):
-        """Context manager for camera operations with timeout"""
-        import threading
-        import time
-        
-        class TimeoutException(Exception):
-            pass
-        
-        def timeout_handler():
-            time.sleep(timeout_seconds)
-            if not getattr(threading.current_thread(), 'completed', False):
-                raise TimeoutException(f"Operation timed out after {timeout_seconds} seconds")
-        
-        timer_thread = threading.Thread(target=timeout_handler, daemon=True)
-        timer_thread.start()
+        """Context manager for camera operations with timeout
+
+        On the main thread SIGALRM interrupts the operation with CameraTimeoutError. Other threads
+        cannot be interrupted, so there the watchdog thread only reports the overrun.
+        """
+        if threading.current_thread() is threading.main_thread() and hasattr(signal, "SIGALRM"):
+            def timeout_handler(signum, frame):
+                raise CameraTimeoutError(f"Operation timed out after {timeout_seconds} seconds")
+            
+            previous_handler = signal.signal(signal.SIGALRM, timeout_handler)
+            previous_timer = signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+            try:
+                yield
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, *previous_timer)
+                signal.signal(signal.SIGALRM, previous_handler)
+            return
         
+        ident = threading.get_ident()
+        with self._watch_lock:
+            outer = self._watched_operations.get(ident)
+            self._watched_operations[ident] = [time.monotonic() + timeout_seconds, timeout_seconds, False]
         try:
             yield
-            timer_thread.completed = True
-        except Exception as e:
-            timer_thread.completed = True
-            raise e
+        finally:
+            with self._watch_lock:
+                if outer is None:
+                    self._watched_operations.pop(ident, None)
+                else:
+                    self._watched_operations[ident] = outer
+
+    def _camera_watchdog_loop(self):
+        """Report worker-thread camera operations that overrun their camera_timeout"""
+        while not self.shutdown_requested:
+            time.sleep(0.5)
+            now = time.monotonic()
+            overdue = []
+            with self._watch_lock:
+                for entry in self._watched_operations.values():
+                    if not entry[2] and now > entry[0]:
+                        entry[2] = True
+                        overdue.append(entry[1])
+            for timeout_seconds in overdue:
+                self.log_message(f"⚠️  Camera operation still running after {timeout_seconds} seconds")
 
     def safe_camera_operation(self, operation, cam, *args, **kwargs):
         """Safely execute camera operations with error handling"""
@@ -182,12 +564,61 @@ class UltraSafeIMX708Viewer:
         finally:
             self.operation_in_progress = False
 
+    def _capture_arrays(self):
+        """Capture a main-stream array from each connected camera under one 3 second timeout
+
+        The direct counterpart of two safe_camera_operation(capture_array) calls; a camera
+        that fails (or the shared timeout) leaves its frame as None.
+        """
+        if self.operation_in_progress:
+            self.log_message("Another operation in progress, please wait...")
+            return None, None
+
+        frames = [None, None]
+        cams = ((self.cam0_connected, self.cam0), (self.cam1_connected, self.cam1))
+        self.operation_in_progress = True
+        try:
+            with self.camera_timeout(3):
+                for index, (connected, cam) in enumerate(cams):
+                    if not (connected and cam):
+                        continue
+                    try:
+                        frames[index] = cam.capture_array()
+                    except CameraTimeoutError:
+                        raise
+                    except Exception as e:
+                        self.log_message(f"Camera operation failed: {e}")
+        except CameraTimeoutError as e:
+            self.log_message(f"Camera operation failed: {e}")
+        finally:
+            self.operation_in_progress = False
+        return frames[0], frames[1]
+
+    def create_camera_config(self, cam):
+        """Build the one configuration both cameras run with for their whole session
+
+        It is applied once at startup; settings changes afterwards only go through
+        set_controls. Single buffer and no queued frame: every capture returns a fresh frame.
+        """
+        return cam.create_still_configuration(
+            raw={"size": (4608, 2592)},
+            lores={"size": PREVIEW_LORES_SIZE},
+            buffer_count=1,
+            queue=False,
+            controls={
+                "ExposureTime": 10000,
+                "AnalogueGain": 1.0
+            }
+        )
+
     def initialize_cameras(self):
         """Initialize cameras with maximum safety"""
         if self.cameras_initializing or self.shutdown_requested:
             return
             
         self.cameras_initializing = True
+        # Fresh camera objects have none of our controls yet
+        self.last_applied_settings = None
         self.log_message("Safely initializing cameras...")
         self.log_message("WARNING: This may take 10-15 seconds, please wait...")
         
@@ -195,20 +626,16 @@ class UltraSafeIMX708Viewer:
             # Try to initialize camera 0
             try:
                 self.log_message("Attempting to initialize camera 0...")
-                from picamera2 import Picamera2
+                if not PICAMERA2_AVAILABLE:
+                    raise ImportError("picamera2 is not installed")
                 
                 with self.camera_timeout(15):  # 15 second timeout for initialization
                     self.cam0 = Picamera2(0)
                     
-                    self.camera_config = self.cam0.create_still_configuration(
-                        raw={"size": (4608, 2592)},
-                        controls={
-                            "ExposureTime": 10000,
-                            "AnalogueGain": 1.0
-                        }
-                    )
-                    
+                    self.camera_config = self.create_camera_config(self.cam0)
                     self.cam0.configure(self.camera_config)
+                    self.preview_swap_rb = self.camera_config["main"]["format"] == "RGB888"
+                    self.set_preview_stream(self.camera_config)
                     self.cam0.start()
                     time.sleep(1)  # Brief stabilization
                     
@@ -237,14 +664,10 @@ class UltraSafeIMX708Viewer:
                         time.sleep(1)
                     else:
                         self.cam1 = Picamera2(1)
-                        backup_config = self.cam1.create_still_configuration(
-                            raw={"size": (4608, 2592)},
-                            controls={
-                                "ExposureTime": 10000,
-                                "AnalogueGain": 1.0
-                            }
-                        )
+                        backup_config = self.create_camera_config(self.cam1)
                         self.cam1.configure(backup_config)
+                        self.preview_swap_rb = backup_config["main"]["format"] == "RGB888"
+                        self.set_preview_stream(backup_config)
                         self.cam1.start()
                         time.sleep(1)
                         
@@ -296,6 +719,48 @@ class UltraSafeIMX708Viewer:
             self.log_message("❌ No cameras connected - GUI ready in simulation mode")
             self.update_status_display("No cameras - Simulation mode")
 
+    def set_preview_stream(self, config):
+        """Use the lores stream for preview when the configuration provides one"""
+        lores = config.get("lores")
+        if lores:
+            self.preview_stream = "lores"
+            self.preview_stream_size = tuple(lores["size"])
+            self.preview_crop_scale = lores["size"][0] / config["main"]["size"][0]
+        else:
+            self.preview_stream = "main"
+            self.preview_stream_size = None
+            self.preview_crop_scale = 1.0
+
+    @contextmanager
+    def preview_frame(self, cam):
+        """Yield one preview frame; lores (Y, U, V) planes are views into the mapped camera buffer"""
+        if self.preview_stream != "lores" or not PICAMERA2_AVAILABLE:
+            yield self.capture_preview_array(cam)
+            return
+        # Render straight from the dmabuf instead of copying it out with capture_array()
+        request = cam.capture_request()
+        try:
+            with MappedArray(request, "lores") as mapped:
+                width, height = self.preview_stream_size
+                yield yuv420_planes(mapped.array, width, height)
+        finally:
+            request.release()
+
+    def _open_preview_frame(self, cam):
+        """Enter preview_frame() for cam; returns (context, frame), the context to be exited after rendering"""
+        context = self.preview_frame(cam)
+        with self.camera_timeout(2):  # 2 second timeout
+            frame = context.__enter__()
+        return context, frame
+
+    def capture_preview_array(self, cam):
+        """Capture one preview frame: RGB from the main stream, (Y, U, V) planes from lores"""
+        if self.preview_stream == "lores":
+            # Kept planar; colour conversion happens after cropping and scaling to display size
+            width, height = self.preview_stream_size
+            return yuv420_planes(cam.capture_array("lores"), width, height)
+        return cam.capture_array()
+
     def update_status_display(self, message):
         """Update GUI status display safely"""
         if hasattr(self, 'status_label') and not self.shutdown_requested:
@@ -315,16 +780,40 @@ class UltraSafeIMX708Viewer:
             timestamp = datetime.now().strftime("%H:%M:%S")
             full_message = f"[{timestamp}] {message}"
             
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.insert(tk.END, full_message + "\n")
-            self.log_text.see(tk.END)
-            self.log_text.config(state=tk.DISABLED)
-            self.root.update_idletasks()
+            # Queue for the Tk main loop; safe to call from worker threads
+            self.log_queue.put_nowait(full_message)
             
             print(full_message)  # Also print to console
         except:
             print(message)  # Fallback
 
+    def _drain_log_queue(self):
+        """Append queued log lines to the log display in one batch"""
+        if self.shutdown_requested:
+            return
+
+        lines = []
+        try:
+            while True:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            try:
+                self.log_text.config(state=tk.NORMAL)
+                self.log_text.insert(tk.END, "\n".join(lines[-LOG_MAX_LINES:]) + "\n")
+                # The widget ends with an empty line after the last newline
+                excess = int(self.log_text.index(tk.END).split('.')[0]) - 2 - LOG_MAX_LINES
+                if excess > 0:
+                    self.log_text.delete("1.0", f"{excess + 1}.0")
+                self.log_text.see(tk.END)
+                self.log_text.config(state=tk.DISABLED)
+            except tk.TclError:
+                return
+
+        self.root.after(100, self._drain_log_queue)
+
     def setup_gui(self):
         self.root = tk.Tk()
         self.root.title("Safe Dual IMX708 Camera Control with Preview")
@@ -403,6 +892,19 @@ class UltraSafeIMX708Viewer:
         ttk.Checkbutton(save_frame, text="Save Combined TIFF", 
                        variable=self.save_tiff_var).pack(anchor=tk.W, padx=5, pady=2)
 
+        # TIFF compression (LZ4/LZW fall back to zlib without imagecodecs; PIL cannot read LZ4)
+        compression_frame = ttk.Frame(save_frame)
+        compression_frame.pack(fill=tk.X, padx=5, pady=2)
+        ttk.Label(compression_frame, text="TIFF Compression:").pack(side=tk.LEFT)
+        self.tiff_compression_var = tk.StringVar(value="none")
+        ttk.Combobox(compression_frame, textvariable=self.tiff_compression_var, width=8,
+                     values=["none", "lz4", "zlib", "lzw"], state="readonly").pack(side=tk.RIGHT)
+
+        # Burst mode: consecutive saves become pages of one TIFF (needs tifffile)
+        self.burst_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(save_frame, text="Burst: Append TIFFs to One File",
+                        variable=self.burst_var, command=self.update_burst_setting).pack(anchor=tk.W, padx=5, pady=2)
+
         self.save_dng_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(save_frame, text="Save Original DNG Files", 
                     variable=self.save_dng_var).pack(anchor=tk.W, padx=5, pady=2)
@@ -444,6 +946,13 @@ class UltraSafeIMX708Viewer:
         fps_combo = ttk.Combobox(rate_frame, textvariable=self.fps_var, width=8, values=["0.5", "1", "2", "3", "5"])
         fps_combo.pack(side=tk.RIGHT)
         fps_combo.bind("<<ComboboxSelected>>", self.on_fps_change)
+        fps_combo.bind("<Return>", self.on_fps_change)
+        fps_combo.bind("<FocusOut>", self.on_fps_change)
+        
+        self.preview_gray_var = tk.BooleanVar(value=self.preview_grayscale)
+        ttk.Checkbutton(preview_controls_frame, text="Grayscale Preview (faster)",
+                        variable=self.preview_gray_var,
+                        command=self.update_preview_grayscale).pack(anchor=tk.W, padx=5, pady=2)
         
         ttk.Button(action_frame, text="🔄 Reset All Parameters", command=self.reset_all).pack(fill=tk.X, padx=5, pady=2)
         ttk.Button(action_frame, text="💾 Save Settings", command=self.save_settings).pack(fill=tk.X, padx=5, pady=2)
@@ -611,6 +1120,7 @@ class UltraSafeIMX708Viewer:
         
         self.preview_canvas = tk.Canvas(preview_frame, width=preview_width, height=preview_height, bg='black')
         self.preview_canvas.pack(padx=5, pady=5)
+        self.preview_canvas.bind("<Configure>", self._on_preview_canvas_configure)
         
         # Preview status
         self.preview_status = ttk.Label(preview_frame, text="Preview stopped", font=('TkDefaultFont', 9))
@@ -624,6 +1134,9 @@ class UltraSafeIMX708Viewer:
         log_inner_frame = ttk.Frame(log_frame)
         log_inner_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Log lines are queued by log_message and drained on the Tk main loop
+        self.log_queue = queue.Queue()
+
         # Reduced height from 15 to 8 (approximately half)
         self.log_text = tk.Text(log_inner_frame, wrap=tk.WORD, state=tk.DISABLED, 
                                font=('Consolas', 9), bg='black', fg='lime', height=8)
@@ -632,6 +1145,7 @@ class UltraSafeIMX708Viewer:
         
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._drain_log_queue()
         
         # Add initial log messages
         self.log_message("Safe Dual IMX708 Camera Control with Preview")
@@ -699,9 +1213,14 @@ class UltraSafeIMX708Viewer:
         self.preview_status.config(text="Preview running...")
         self.log_message("▶️ Starting safe Tkinter preview...")
         
-        # Start preview in background thread
-        self.preview_thread = threading.Thread(target=self._preview_worker, daemon=True)
-        self.preview_thread.start()
+        # Drive the preview from the Tk main loop
+        self.preview_frame_count = 0
+        self.preview_last_time = time.monotonic()
+        self.preview_frame_times.clear()
+        self.preview_fps_shown = 0.0
+        # A cycle started before the last stop may still be running; the tick keeps
+        # polling until it publishes instead of starting a second one alongside it
+        self._preview_tick()
 
     def stop_preview(self):
         """Stop preview safely"""
@@ -709,206 +1228,325 @@ class UltraSafeIMX708Viewer:
             return
             
         self.preview_running = False
+        if self.preview_after_id is not None:
+            self.root.after_cancel(self.preview_after_id)
+            self.preview_after_id = None
         self.preview_button.config(text="▶️ Start Preview")
         self.preview_status.config(text="Preview stopped")
         self.log_message("⏹️ Stopping preview...")
         
         # Clear preview canvas
         try:
-            self.preview_canvas.delete("all")
+            self._clear_preview_canvas()
             self.preview_canvas.create_text(480, 180, text="Preview Stopped", fill="white", font=('Arial', 14))
         except:
             pass
 
-    def _preview_worker(self):
-        """Background worker for safe Tkinter preview"""
-        frame_count = 0
-        last_time = time.time()
+    def _clear_preview_canvas(self):
+        """Remove everything from the preview canvas, including the persistent frame items"""
+        self.preview_canvas.delete("all")
+        self.preview_items = None
+
+    def _on_preview_canvas_configure(self, event=None):
+        """Recreate the preview items at the new canvas size on the next frame"""
+        if self.preview_items is not None:
+            self._clear_preview_canvas()
+
+    def _capture_preview_frames(self, canvas_width, canvas_height):
+        """Capture and render one preview frame (runs on the preview executor)"""
+        frame0 = None
+        frame1 = None
+        errors = []
+        result = None
         
         try:
-            # Get frame rate from GUI
-            fps = float(self.fps_var.get())
-            frame_delay = 1.0 / fps
+            # Mapped lores buffers go back to the camera when the stack closes, after rendering
+            with ExitStack() as requests:
+                # Cam1 waits for its frame on its own worker while cam0 waits here,
+                # so a frame costs the slower capture rather than both in turn
+                cam1_future = None
+                if self.cam1_connected and self.cam1:
+                    cam1_future = self.preview_cam1_executor.submit(self._open_preview_frame, self.cam1)
+                
+                if self.cam0_connected and self.cam0:
+                    try:
+                        context, frame0 = self._open_preview_frame(self.cam0)
+                        requests.push(context.__exit__)
+                    except Exception as e:
+                        errors.append(f"⚠️  Cam0 preview capture failed: {e}")
+                
+                if cam1_future is not None:
+                    try:
+                        context, frame1 = cam1_future.result()
+                        requests.push(context.__exit__)
+                    except Exception as e:
+                        errors.append(f"⚠️  Cam1 preview capture failed: {e}")
+                        
+                if frame0 is None and frame1 is None:
+                    result = (None, False, errors)
+                else:
+                    # Crop/resize here so the Tk thread only has to blit the result
+                    lores = self.preview_stream == "lores"
+                    result = (self._render_preview_frame(frame0, frame1, canvas_width, canvas_height,
+                                                         crop_scale=self.preview_crop_scale,
+                                                         swap_rb=self.preview_swap_rb and not lores), True, errors)
+        except Exception as e:
+            result = (None, False, errors + [f"⚠️  Preview capture failed: {e}"])
+        finally:
+            if result is None:
+                result = (None, False, errors)
+            # Always publish, or the Tk thread would poll for this cycle forever.
+            # Replace any frame the Tk thread has not picked up yet; only the newest is shown
+            with self._pending_lock:
+                self._pending_frame = result
+
+    def _preview_tick(self):
+        """One step of the preview loop, always on the Tk main thread"""
+        self.preview_after_id = None
+        if not self.preview_running or self.shutdown_requested:
+            return
             
-            while self.preview_running and not self.shutdown_requested:
-                try:
-                    # Respect frame rate
-                    current_time = time.time()
-                    if current_time - last_time < frame_delay:
-                        time.sleep(0.05)
-                        continue
-                    last_time = current_time
-                    
-                    # Capture frames safely
-                    frame0 = None
-                    frame1 = None
-                    
-                    if self.cam0_connected and self.cam0:
-                        try:
-                            with self.camera_timeout(2):  # 2 second timeout
-                                frame0 = self.cam0.capture_array()
-                        except Exception as e:
-                            if frame_count % 20 == 0:  # Log every 20th error only
-                                self.log_message(f"⚠️  Cam0 preview capture failed: {e}")
-                    
-                    if self.cam1_connected and self.cam1:
-                        try:
-                            with self.camera_timeout(2):  # 2 second timeout
-                                frame1 = self.cam1.capture_array()
-                        except Exception as e:
-                            if frame_count % 20 == 0:  # Log every 20th error only
-                                self.log_message(f"⚠️  Cam1 preview capture failed: {e}")
-                    
-                    # Update preview display using Tkinter-safe method
-                    if frame0 is not None or frame1 is not None:
-                        self.root.after(0, self._update_preview_display, frame0, frame1)
-                    else:
-                        self.root.after(0, self._update_preview_disconnected)
+        fps = self.preview_fps_target
+            
+        # Take the newest rendered frame, if the capture worker has published one
+        with self._pending_lock:
+            pending, self._pending_frame = self._pending_frame, None
+            
+        if pending is not None:
+            self.preview_capture_busy = False
+            try:
+                preview_image, has_frames, errors = pending
+                if errors and self.preview_frame_count % 20 == 0:  # Log every 20th error only
+                    for error in errors:
+                        self.log_message(error)
+                
+                if has_frames:
+                    self._blit_preview(preview_image)
+                else:
+                    self._update_preview_disconnected()
                     
-                    frame_count += 1
+                self.preview_frame_count += 1
+                self.preview_frame_times.append(time.monotonic())
+                
+                # Update status periodically, measured over the last 10 displayed frames
+                times = self.preview_frame_times
+                if self.preview_frame_count % 10 == 0 and len(times) > 1:
+                    fps_actual = (len(times) - 1) / (times[-1] - times[0])
+                    if abs(fps_actual - self.preview_fps_shown) >= 0.1:
+                        self.preview_fps_shown = fps_actual
+                        self.preview_status.config(text=f"Preview running - {fps_actual:.1f} FPS (target: {fps})")
                     
-                    # Update status periodically
-                    if frame_count % 10 == 0:
-                        fps_actual = 10.0 / (time.time() - last_time) if frame_count > 0 else 0
-                        status_text = f"Preview running - {fps_actual:.1f} FPS (target: {fps})"
-                        self.root.after(0, lambda: self.preview_status.config(text=status_text))
-                        
-                except Exception as e:
-                    if frame_count % 20 == 0:  # Only log every 20th error
-                        self.log_message(f"⚠️  Preview error: {e}")
-                    time.sleep(0.1)
+            except Exception as e:
+                if self.preview_frame_count % 20 == 0:  # Only log every 20th error
+                    self.log_message(f"⚠️  Preview error: {e}")
                     
-        except Exception as e:
-            self.log_message(f"❌ Preview worker crashed: {e}")
-        finally:
-            self.preview_running = False
-            self.root.after(0, lambda: self.preview_button.config(text="▶️ Start Preview"))
-            self.root.after(0, lambda: self.preview_status.config(text="Preview stopped"))
+        if self.preview_capture_busy:
+            # Capture still in flight; check the slot again shortly
+            self.preview_after_id = self.root.after(20, self._preview_tick)
+            return
+            
+        if pending is None:
+            # Start the next capture; its result arrives through the frame slot
+            self.preview_last_time = time.monotonic()
+            self.preview_capture_busy = True
+            canvas_width, canvas_height = self._get_preview_canvas_size()
+            self.preview_executor.submit(self._capture_preview_frames, canvas_width, canvas_height)
+            self.preview_after_id = self.root.after(20, self._preview_tick)
+            return
+            
+        # The next capture is due one frame period after this one started, so
+        # wait only for what is left of the period rather than a full period on top
+        remaining = self.preview_last_time + 1.0 / fps - time.monotonic()
+        self.preview_after_id = self.root.after(max(0, int(remaining * 1000)), self._preview_tick)
+
+    def _get_preview_canvas_size(self):
+        """Return the preview canvas size (Tk main thread only)"""
+        canvas_width = self.preview_canvas.winfo_width()
+        canvas_height = self.preview_canvas.winfo_height()
+        
+        # Use canvas dimensions if available, otherwise fall back to configured size
+        if canvas_width <= 1 or canvas_height <= 1:
+            canvas_width = 800
+            canvas_height = int(800 * 2592 / 4090)
+        return canvas_width, canvas_height
 
     def _update_preview_display(self, frame0, frame1):
-        """Update preview display safely in Tkinter main thread"""
+        """Render and show a preview frame in the Tkinter main thread"""
+        canvas_width, canvas_height = self._get_preview_canvas_size()
+        self._blit_preview(self._render_preview_frame(frame0, frame1, canvas_width, canvas_height))
+
+    def _render_preview_frame(self, frame0, frame1, canvas_width, canvas_height, crop_scale=1.0, swap_rb=None):
+        """Crop, scale and combine frames into a display-sized PIL image (no Tk calls, safe in workers)"""
+        if swap_rb is None:
+            swap_rb = self.preview_swap_rb
         try:
-            # Clear canvas
-            self.preview_canvas.delete("all")
+            # Apply cropping to match output dimensions
+            crops = []
+            for frame, cam_name in ((frame0, 'cam0'), (frame1, 'cam1')):
+                if frame is None:
+                    continue
+                if isinstance(frame, tuple):
+                    # Planar lores frame (Y, U, V)
+                    crops.append(self.crop_planes(frame, cam_name, crop_scale))
+                    continue
+                frame_scale = crop_scale
+                if frame.ndim == 2 and frame.dtype == np.uint16:
+                    # Raw Bayer frame: bin to half-resolution 8-bit RGB before anything else
+                    frame = raw16_to_rgb8(frame, self._raw_rgb_buf.get(cam_name))
+                    self._raw_rgb_buf[cam_name] = frame
+                    frame_scale = crop_scale / 2
+                crops.append(self.crop_image(frame, cam_name, frame_scale))
+            if not crops:
+                return None
+            grayscale = self.preview_grayscale
+            if grayscale and isinstance(crops[0], tuple):
+                # The Y plane is the grayscale image; the chroma planes are never touched
+                crops = [planes[0] for planes in crops]
+                
+            # Side-by-side preview matching output TIFF dimensions
+            combined_image = self._fit_to_canvas(crops, canvas_width, canvas_height)
             
-            # Get current canvas dimensions
-            canvas_width = self.preview_canvas.winfo_width()
-            canvas_height = self.preview_canvas.winfo_height()
+            # Deep frames become 8-bit for display; done after the downscale, where it touches fewest bytes
+            if combined_image is not None and combined_image.dtype in (np.uint16, np.int16):
+                if self._preview_u8_buf is None or self._preview_u8_buf.shape != combined_image.shape:
+                    self._preview_u8_buf = np.empty(combined_image.shape, dtype=np.uint8)
+                combined_image = cv2.convertScaleAbs(combined_image, dst=self._preview_u8_buf,
+                                                     alpha=255.0 / np.iinfo(combined_image.dtype).max)
             
-            # Use canvas dimensions if available, otherwise fall back to configured size
-            if canvas_width <= 1 or canvas_height <= 1:
-                canvas_width = 800
-                canvas_height = int(800 * 2592 / 4090)
+            if combined_image is None:
+                return None
+            if grayscale and combined_image.ndim == 3 and combined_image.shape[2] == 3:
+                # Converted at display size, after the downscale
+                if self._gray_buf is None or self._gray_buf.shape != combined_image.shape[:2]:
+                    self._gray_buf = np.empty(combined_image.shape[:2], dtype=np.uint8)
+                combined_image = cv2.cvtColor(combined_image, cv2.COLOR_BGR2GRAY if swap_rb else cv2.COLOR_RGB2GRAY,
+                                              dst=self._gray_buf)
+            # PIL copies the reused buffer here, so the next render can't overwrite a frame
+            # the Tk thread has yet to show. Frames are already RGB unless the main stream
+            # was configured as RGB888 (B,G,R order); that swap rides along with the copy.
+            if combined_image.ndim == 3 and combined_image.shape[2] == 3:
+                height, width = combined_image.shape[:2]
+                return Image.frombuffer("RGB", (width, height), combined_image, "raw",
+                                        "BGR" if swap_rb else "RGB", 0, 1)
+            # fromarray shares the memory of 1- and 4-channel arrays, hence the copy
+            return Image.fromarray(combined_image).copy()
             
-            combined_image = None
+        except Exception as e:
+            self.log_message(f"❌ Preview render error: {e}")
+            return None
+
+    def _fit_to_canvas(self, images, canvas_width, canvas_height):
+        """Scale one or two images side by side to fit the canvas, into the reused preview buffer"""
+        # Planar (Y, U, V) frames are measured by their luma plane and come out as 8-bit RGB
+        planar = isinstance(images[0], tuple)
+        shapes = tuple(image[0].shape if planar else image.shape for image in images)
+        dtype = np.uint8 if planar else images[0].dtype
+        key = (planar, shapes, dtype, canvas_width, canvas_height)
+        if self._preview_plan is None or self._preview_plan[0] != key:
+            self._preview_plan = (key, self._plan_preview_layout(planar, shapes, dtype, canvas_width, canvas_height))
+        min_height, buffer, targets = self._preview_plan[1]
+            
+        # Resize each image straight into its side of the buffer (no full-resolution hstack)
+        for image, (size, dst) in zip(images, targets):
+            if planar:
+                self._resize_planes_to_rgb(image, min_height, size, dst)
+            else:
+                self._resize_for_preview(image[:min_height], size, dst=dst)
+        return buffer
+
+    def _plan_preview_layout(self, planar, shapes, dtype, canvas_width, canvas_height):
+        """Work out the preview layout once per frame shape and canvas size
+
+        Returns (rows used from each image, side-by-side buffer, [(display size, buffer view)]).
+        """
+        # Match heights for side-by-side combination (like the output TIFF)
+        min_height = min(shape[0] for shape in shapes)
+        orig_width = sum(shape[1] for shape in shapes)
+        
+        # Calculate scaling factor to fit within canvas while maintaining aspect ratio
+        scale = min(canvas_width / orig_width, canvas_height / min_height)
+        new_height = max(1, int(min_height * scale))
+        new_widths = [max(1, int(shape[1] * scale)) for shape in shapes]
+        if planar:
+            # 4:2:0 chroma needs even output dimensions
+            new_height = max(2, new_height & ~1)
+            new_widths = [max(2, width & ~1) for width in new_widths]
+        
+        channels = (3,) if planar else shapes[0][2:]
+        buffer = np.empty((new_height, sum(new_widths)) + channels, dtype=dtype)
+        targets = []
+        x = 0
+        for new_width in new_widths:
+            targets.append(((new_width, new_height), buffer[:, x:x + new_width]))
+            x += new_width
+        return min_height, buffer, targets
+
+    def _resize_planes_to_rgb(self, planes, rows, size, dst):
+        """Scale Y, U and V planes to display size, then convert only those pixels to RGB"""
+        width, height = size
+        i420 = self._i420_buf.get(size)
+        if i420 is None:
+            if len(self._i420_buf) >= 4:
+                # Drop scratch buffers left over from earlier canvas sizes
+                self._i420_buf.clear()
+            i420 = np.empty(width * height * 3 // 2, dtype=np.uint8)
+            self._i420_buf[size] = i420
+        luma = width * height
+        chroma = luma // 4
+        y, u, v = planes
+        self._resize_for_preview(y[:rows], size, dst=i420[:luma].reshape(height, width))
+        self._resize_for_preview(u[:rows // 2], (width // 2, height // 2),
+                                 dst=i420[luma:luma + chroma].reshape(height // 2, width // 2))
+        self._resize_for_preview(v[:rows // 2], (width // 2, height // 2),
+                                 dst=i420[luma + chroma:].reshape(height // 2, width // 2))
+        cv2.cvtColor(i420.reshape(height * 3 // 2, width), cv2.COLOR_YUV2RGB_I420, dst=dst)
+
+    def _resize_for_preview(self, image, size, dst=None):
+        """Downscale for display in one bilinear pass
+
+        At large factors INTER_LINEAR only reads the 2x2 source pixels around each output sample,
+        i.e. a strided decimation of the crop view, which touches far fewer bytes than area averaging.
+        """
+        return cv2.resize(image, size, dst=dst, interpolation=cv2.INTER_LINEAR)
+
+    def _blit_preview(self, pil_image):
+        """Show a rendered preview frame on the canvas (Tk main thread only)"""
+        if pil_image is None:
+            return
+            
+        try:
+            canvas_width, canvas_height = self._get_preview_canvas_size()
+            
+            # Reuse the PhotoImage while the preview size is unchanged
+            if (self.preview_photo is not None and self.preview_photo.width() == pil_image.width
+                    and self.preview_photo.height() == pil_image.height):
+                self.preview_photo.paste(pil_image)
+            else:
+                self.preview_photo = ImageTk.PhotoImage(pil_image)
+            
+            # Create the image and overlay items once, centered on the canvas
+            if self.preview_items is None:
+                canvas_center_x = canvas_width // 2
+                canvas_center_y = canvas_height // 2
+                self.preview_canvas.delete("all")
+                self.preview_items = {
+                    'image': self.preview_canvas.create_image(canvas_center_x, canvas_center_y),
+                    'overlay': self.preview_canvas.create_text(canvas_center_x, 15, text="", fill="yellow", font=('Arial', 12, 'bold')),
+                    'dims': self.preview_canvas.create_text(canvas_center_x, canvas_height - 15, text="", fill="cyan", font=('Arial', 10))
+                }
+            self.preview_canvas.itemconfig(self.preview_items['image'], image=self.preview_photo)
+            
+            # Overlay text at top
+            cam0_status = "✓" if self.cam0_connected else "✗"
+            cam1_status = "✓" if self.cam1_connected else "✗"
+            overlay_text = f"Cam0: {cam0_status}  Cam1: {cam1_status}"
+            self.preview_canvas.itemconfig(self.preview_items['overlay'], text=overlay_text)
+            
+            # Dimension info at bottom
+            img_width, img_height = pil_image.size
+            dim_text = f"Preview: {img_width}×{img_height} (Scaled from cropped)"
+            self.preview_canvas.itemconfig(self.preview_items['dims'], text=dim_text)
             
-            if frame0 is not None or frame1 is not None:
-                # Create side-by-side preview matching output TIFF dimensions
-                if frame0 is not None and frame1 is not None:
-                    # Both cameras - process and combine like the output TIFF
-                    try:
-                        # Apply cropping to match output dimensions
-                        crop0 = self.crop_image(frame0, 'cam0') if self.apply_cropping else frame0
-                        crop1 = self.crop_image(frame1, 'cam1') if self.apply_cropping else frame1
-                        
-                        # Get cropped dimensions
-                        h0, w0 = crop0.shape[:2]
-                        h1, w1 = crop1.shape[:2]
-                        
-                        # Match heights for side-by-side combination
-                        min_height = min(h0, h1)
-                        crop0_resized = crop0[:min_height, :]
-                        crop1_resized = crop1[:min_height, :]
-                        
-                        # Combine horizontally (like the output TIFF)
-                        combined_raw = np.hstack((crop0_resized, crop1_resized))
-                        
-                        # Scale to fit canvas while maintaining aspect ratio
-                        orig_height, orig_width = combined_raw.shape[:2]
-                        
-                        # Calculate scaling factor to fit within canvas
-                        scale_x = canvas_width / orig_width
-                        scale_y = canvas_height / orig_height
-                        scale = min(scale_x, scale_y)
-                        
-                        new_width = int(orig_width * scale)
-                        new_height = int(orig_height * scale)
-                        
-                        import cv2
-                        combined_image = cv2.resize(combined_raw, (new_width, new_height), interpolation=cv2.INTER_AREA)
-                        
-                    except Exception as e:
-                        self.log_message(f"Preview processing error: {e}")
-                        return
-                        
-                elif frame0 is not None:
-                    # Only camera 0
-                    try:
-                        crop0 = self.crop_image(frame0, 'cam0') if self.apply_cropping else frame0
-                        orig_height, orig_width = crop0.shape[:2]
-                        
-                        # Scale to fit canvas
-                        scale_x = canvas_width / orig_width
-                        scale_y = canvas_height / orig_height
-                        scale = min(scale_x, scale_y)
-                        
-                        new_width = int(orig_width * scale)
-                        new_height = int(orig_height * scale)
-                        
-                        import cv2
-                        combined_image = cv2.resize(crop0, (new_width, new_height), interpolation=cv2.INTER_AREA)
-                    except:
-                        return
-                        
-                elif frame1 is not None:
-                    # Only camera 1
-                    try:
-                        crop1 = self.crop_image(frame1, 'cam1') if self.apply_cropping else frame1
-                        orig_height, orig_width = crop1.shape[:2]
-                        
-                        # Scale to fit canvas
-                        scale_x = canvas_width / orig_width
-                        scale_y = canvas_height / orig_width
-                        scale = min(scale_x, scale_y)
-                        
-                        new_width = int(orig_width * scale)
-                        new_height = int(orig_height * scale)
-                        
-                        import cv2
-                        combined_image = cv2.resize(crop1, (new_width, new_height), interpolation=cv2.INTER_AREA)
-                    except:
-                        return
-                
-                # Convert to PIL Image and display
-                if combined_image is not None:
-                    # Convert BGR to RGB
-                    if len(combined_image.shape) == 3:
-                        import cv2
-                        combined_image = cv2.cvtColor(combined_image, cv2.COLOR_BGR2RGB)
-                    
-                    # Convert to PIL Image
-                    from PIL import Image, ImageTk
-                    pil_image = Image.fromarray(combined_image)
-                    
-                    # Convert to PhotoImage
-                    self.preview_photo = ImageTk.PhotoImage(pil_image)
-                    
-                    # Center the image on canvas
-                    canvas_center_x = canvas_width // 2
-                    canvas_center_y = canvas_height // 2
-                    self.preview_canvas.create_image(canvas_center_x, canvas_center_y, image=self.preview_photo)
-                    
-                    # Add overlay text at top
-                    cam0_status = "✓" if self.cam0_connected else "✗"
-                    cam1_status = "✓" if self.cam1_connected else "✗"
-                    overlay_text = f"Cam0: {cam0_status}  Cam1: {cam1_status}"
-                    self.preview_canvas.create_text(canvas_center_x, 15, text=overlay_text, fill="yellow", font=('Arial', 12, 'bold'))
-                    
-                    # Add dimension info at bottom
-                    img_height, img_width = combined_image.shape[:2]
-                    dim_text = f"Preview: {img_width}×{img_height} (Scaled from cropped)"
-                    self.preview_canvas.create_text(canvas_center_x, canvas_height - 15, text=dim_text, fill="cyan", font=('Arial', 10))
-                    
         except Exception as e:
             self.log_message(f"❌ Preview display error: {e}")
             self._update_preview_error()
@@ -916,7 +1554,7 @@ class UltraSafeIMX708Viewer:
     def _update_preview_disconnected(self):
         """Show disconnected status in preview"""
         try:
-            self.preview_canvas.delete("all")
+            self._clear_preview_canvas()
             canvas_width = self.preview_canvas.winfo_width() or 800
             canvas_height = self.preview_canvas.winfo_height() or int(800 * 2592 / 4090)
             center_x = canvas_width // 2
@@ -930,7 +1568,7 @@ class UltraSafeIMX708Viewer:
     def _update_preview_error(self):
         """Show error status in preview"""
         try:
-            self.preview_canvas.delete("all")
+            self._clear_preview_canvas()
             canvas_width = self.preview_canvas.winfo_width() or 800
             canvas_height = self.preview_canvas.winfo_height() or int(800 * 2592 / 4090)
             center_x = canvas_width // 2
@@ -950,14 +1588,7 @@ class UltraSafeIMX708Viewer:
         self.log_message("📷 Capturing single frame for preview...")
         
         try:
-            frame0 = None
-            frame1 = None
-            
-            if self.cam0_connected and self.cam0:
-                frame0 = self.safe_camera_operation(lambda cam: cam.capture_array(), self.cam0)
-                
-            if self.cam1_connected and self.cam1:
-                frame1 = self.safe_camera_operation(lambda cam: cam.capture_array(), self.cam1)
+            frame0, frame1 = self._capture_arrays()
             
             if frame0 is not None or frame1 is not None:
                 self._update_preview_display(frame0, frame1)
@@ -973,9 +1604,14 @@ class UltraSafeIMX708Viewer:
         """Handle FPS change"""
         try:
             fps = float(self.fps_var.get())
-            self.log_message(f"Preview FPS changed to {fps}")
+            if fps <= 0:
+                raise ValueError(fps)
         except:
             self.fps_var.set("2")  # Reset to default
+            fps = 2.0
+        if fps != self.preview_fps_target:
+            self.preview_fps_target = fps
+            self.log_message(f"Preview FPS changed to {fps}")
 
     def test_capture(self):
         """Test single image capture without saving"""
@@ -990,7 +1626,8 @@ class UltraSafeIMX708Viewer:
                 req0 = self.safe_camera_operation(lambda cam: cam.capture_request(), self.cam0)
                 if req0:
                     array = req0.make_array("main")
-                    self.log_message(f"✓ Cam0: {array.shape}, dtype: {array.dtype}, range: [{array.min()}-{array.max()}]")
+                    low, high = array_range(array)
+                    self.log_message(f"✓ Cam0: {array.shape}, dtype: {array.dtype}, range: [{low}-{high}]")
                     req0.release()
                 else:
                     self.log_message("✗ Cam0 capture failed")
@@ -999,7 +1636,8 @@ class UltraSafeIMX708Viewer:
                 req1 = self.safe_camera_operation(lambda cam: cam.capture_request(), self.cam1)
                 if req1:
                     array = req1.make_array("main")
-                    self.log_message(f"✓ Cam1: {array.shape}, dtype: {array.dtype}, range: [{array.min()}-{array.max()}]")
+                    low, high = array_range(array)
+                    self.log_message(f"✓ Cam1: {array.shape}, dtype: {array.dtype}, range: [{low}-{high}]")
                     req1.release()
                 else:
                     self.log_message("✗ Cam1 capture failed")
@@ -1021,12 +1659,34 @@ class UltraSafeIMX708Viewer:
             return
             
         self.log_message("💾 Starting safe image capture and save...")
+        pending = self.pending_writes()
+        if pending:
+            self.log_message(f"🕒 {pending} earlier file write(s) still in progress")
         
         # Run in background thread to prevent GUI blocking
         threading.Thread(target=self._save_image_worker, daemon=True).start()
 
+    def submit_dng(self, req, dng_path):
+        """Write req's raw frame to dng_path on io_executor, counting it as in flight"""
+        with self._dng_lock:
+            self._dng_inflight += 1
+        future = self.io_executor.submit(req.save_dng, dng_path)
+        future.add_done_callback(self._dng_done)
+        return future
+
+    def _dng_done(self, future):
+        with self._dng_lock:
+            self._dng_inflight -= 1
+
+    def pending_writes(self):
+        """Return the number of DNG and TIFF writes that have not reached the disk yet"""
+        return self._dng_inflight + self.tiff_queue.unfinished_tasks
+
     def _save_image_worker(self):
         """Worker thread for image saving"""
+        req0 = None
+        req1 = None
+        dng_futures = []
         try:
             self.operation_in_progress = True
             
@@ -1044,12 +1704,10 @@ class UltraSafeIMX708Viewer:
                 self.log_message(f"📁 Created folder: {save_folder}")
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            params_str = "_".join(f"{p}{v['value']:.2f}" for p, v in self.params.items())
+            params_str = self._params_str
+            tiff_compression = self.tiff_compression_var.get()
 
             # Capture from available cameras
-            req0 = None
-            req1 = None
-            
             if self.cam0_connected:
                 self.log_message("📸 Capturing from Camera 0...")
                 req0 = self.cam0.capture_request()
@@ -1068,26 +1726,14 @@ class UltraSafeIMX708Viewer:
 
             success_count = 0
 
-            # Save DNG files if enabled
+            # Save DNG files if enabled (written in the background while the TIFF is processed)
             if self.save_dng_var.get():
                 self.log_message("💾 Saving DNG files...")
-                try:
-                    if req0:
-                        dng_filename0 = f"cam0_{timestamp}_original_{params_str}.dng"
-                        dng_path0 = os.path.join(save_folder, dng_filename0)
-                        req0.save_dng(dng_path0)
-                        self.log_message(f"✓ Saved: {dng_path0}")
-                        success_count += 1
-                        
-                    if req1:
-                        dng_filename1 = f"cam1_{timestamp}_original_{params_str}.dng"
-                        dng_path1 = os.path.join(save_folder, dng_filename1)
-                        req1.save_dng(dng_path1)
-                        self.log_message(f"✓ Saved: {dng_path1}")
-                        success_count += 1
-                        
-                except Exception as e:
-                    self.log_message(f"❌ DNG save error: {e}")
+                for cam_name, req in (('cam0', req0), ('cam1', req1)):
+                    if req:
+                        dng_filename = f"{cam_name}_{timestamp}_original_{params_str}.dng"
+                        dng_path = os.path.join(save_folder, dng_filename)
+                        dng_futures.append((dng_path, self.submit_dng(req, dng_path)))
 
             # Create processed TIFF if enabled
             if self.save_tiff_var.get():
@@ -1099,21 +1745,27 @@ class UltraSafeIMX708Viewer:
                     if img0 is not None or img1 is not None:
                         # Process images
                         self.log_message("🔄 Applying image processing pipeline...")
-                        img0_final = self.process_image(img0, 'cam0') if img0 is not None else None
-                        img1_final = self.process_image(img1, 'cam1') if img1 is not None else None
+                        f0 = self.process_executor.submit(self.process_image, img0, 'cam0', False)
+                        f1 = self.process_executor.submit(self.process_image, img1, 'cam1', False)
+                        img0_final, img1_final = f0.result(), f1.result()
                         
-                        # Create combined image
+                        # Rotate both sides straight into the combined image
                         self.log_message("🔄 Creating combined image...")
-                        combined = self.create_combined_image(img0_final, img1_final)
+                        combined = self.create_rotated_combined_image(img0_final, img1_final)
                         
                         if combined is not None:
-                            tiff_filename = f"dual_{timestamp}_processed_{params_str}.tiff"
-                            tiff_path = os.path.join(save_folder, tiff_filename)
-                            if self.save_processed_image_tiff(combined, tiff_path):
-                                self.log_message(f"✓ Saved: {tiff_path}")
-                                success_count += 1
+                            burst = TIFFFILE_AVAILABLE and self.burst_var.get()
+                            if burst:
+                                if self.burst_path is None:
+                                    self.start_burst(os.path.join(save_folder, f"burst_{timestamp}_processed_{params_str}.tiff"))
+                                tiff_path = self.burst_path
                             else:
-                                self.log_message("❌ TIFF save failed")
+                                tiff_filename = f"dual_{timestamp}_processed_{params_str}.tiff"
+                                tiff_path = os.path.join(save_folder, tiff_filename)
+                            # get_combined_buffer won't reuse combined until this write is done
+                            self.tiff_queue.put((tiff_path, combined, tiff_compression, burst))
+                            self.log_message(f"🕒 Queued TIFF for writing: {tiff_path}")
+                            success_count += 1
                         else:
                             self.log_message("❌ Failed to create combined image")
                     else:
@@ -1121,19 +1773,30 @@ class UltraSafeIMX708Viewer:
                         
                 except Exception as e:
                     self.log_message(f"❌ TIFF processing error: {e}")
-                    import traceback
                     self.log_message(f"Full error: {traceback.format_exc()}")
 
+            for dng_path, future in dng_futures:
+                try:
+                    future.result()
+                    self.log_message(f"✓ Saved: {dng_path}")
+                    success_count += 1
+                except Exception as e:
+                    self.log_message(f"❌ DNG save error: {e}")
+
             self.log_message(f"🎉 Save operation complete! {success_count} files saved.")
+            pending = self.pending_writes()
+            if pending:
+                self.log_message(f"🕒 {pending} file write(s) still queued")
             if success_count > 0:
                 self.log_message(f"Files saved in: {save_folder}")
 
         except Exception as e:
             self.log_message(f"❌ Save operation error: {e}")
-            import traceback
             self.log_message(f"Full error: {traceback.format_exc()}")
         
         finally:
+            # DNG writers read straight from the request buffers
+            wait([future for _, future in dng_futures])
             self.operation_in_progress = False
             # Always release requests
             try:
@@ -1144,8 +1807,8 @@ class UltraSafeIMX708Viewer:
             except:
                 pass
 
-    def process_image(self, image, cam_name):
-        """Process a single image through the pipeline"""
+    def process_image(self, image, cam_name, rotate=True):
+        """Process a single image through the pipeline (rotate=False stops before rotation)"""
         if image is None:
             return None
             
@@ -1154,22 +1817,30 @@ class UltraSafeIMX708Viewer:
             self.log_message(f"🔄 Processing {cam_name}: {original_shape}")
             
             # Apply cropping
-            if self.apply_cropping:
+            if self._do_crop:
                 image = self.crop_image(image, cam_name)
                 self.log_message(f"  ✓ Cropped: {original_shape} -> {image.shape}")
                 
+            # Distortion, perspective and rotation collapse into one remap
+            fused = self.use_fused_remap(cam_name)
+                
             # Apply distortion correction
-            if self.enable_distortion_correction:
+            if self.enable_distortion_correction and not fused:
                 image = self.apply_distortion_correction(image, cam_name)
                 self.log_message(f"  ✓ Distortion corrected")
                 
             # Apply perspective correction
-            if self.enable_perspective_correction:
+            if self.enable_perspective_correction and not fused:
                 image = self.apply_perspective_correction(image, cam_name)
                 self.log_message(f"  ✓ Perspective corrected")
                 
             # Apply rotation
-            if cam_name == 'cam0' and self.apply_left_rotation:
+            if not rotate:
+                return image
+            if fused:
+                image = self.apply_fused_correction(image, cam_name)
+                self.log_message(f"  ✓ Distortion + perspective + rotation applied in one remap")
+            elif cam_name == 'cam0' and self.apply_left_rotation:
                 image = self.rotate_left_image(image)
                 self.log_message(f"  ✓ Left rotation applied")
             elif cam_name == 'cam1' and self.apply_right_rotation:
@@ -1234,6 +1905,16 @@ class UltraSafeIMX708Viewer:
         self.log_message("Cleaning up resources...")
         self.stop_preview()  # Ensure preview is stopped
         self.save_settings()
+        self.preview_executor.shutdown(wait=False)
+        self.preview_cam1_executor.shutdown(wait=False)
+        self.process_executor.shutdown(wait=True)
+        # Let queued TIFFs reach the disk before exiting
+        self.stop_burst()
+        pending = self.pending_writes()
+        if pending:
+            self.log_message(f"🕒 Waiting for {pending} pending file write(s)...")
+        self.tiff_queue.join()
+        self.io_executor.shutdown(wait=True)
         self.safe_stop_cameras()
 
     def run(self):
@@ -1247,70 +1928,118 @@ class UltraSafeIMX708Viewer:
             self.cleanup()
 
     # Include all the processing methods from the original
-    def crop_image(self, image, cam_name):
-        """Crop image according to camera-specific parameters"""
-        if not self.apply_cropping:
+    def update_crop_slices(self):
+        """Precompute per-camera crop slices from the current crop settings"""
+        self._crop_slices = {
+            cam: (slice(0, p['height']), slice(p['start_x'], p['start_x'] + p['width']))
+            for cam, p in self.crop_params.items()
+        }
+        # Slices for smaller streams are filled lazily per (camera, scale)
+        self._scaled_crop_slices = {}
+        self._do_crop = self.apply_cropping
+
+    def get_crop_slices(self, cam_name, scale=1.0):
+        """Return the (rows, columns) crop slices for a stream scale relative to the main stream"""
+        if scale == 1.0:
+            return self._crop_slices[cam_name]
+
+        slices = self._scaled_crop_slices.get((cam_name, scale))
+        if slices is None:
+            params = self.crop_params[cam_name]
+            start_x = int(params['start_x'] * scale)
+            width = int(params['width'] * scale)
+            height = int(params['height'] * scale)
+            slices = (slice(0, height), slice(start_x, start_x + width))
+            self._scaled_crop_slices[(cam_name, scale)] = slices
+        return slices
+
+    def crop_image(self, image, cam_name, scale=1.0):
+        """Crop image according to camera-specific parameters (scale maps them onto smaller streams)"""
+        if not self._do_crop:
             return image
-            
-        params = self.crop_params[cam_name]
-        start_x = params['start_x']
-        width = params['width']
-        height = params['height']
-        
-        cropped = image[:height, start_x:start_x + width]
-        return cropped
+        return image[self.get_crop_slices(cam_name, scale)]
+
+    def crop_planes(self, planes, cam_name, scale=1.0):
+        """Crop (Y, U, V) planes on even luma bounds so the half-size chroma stays aligned"""
+        if not self._do_crop:
+            return planes
+        rows, cols = self.get_crop_slices(cam_name, scale)
+        height, start, stop = rows.stop & ~1, cols.start & ~1, cols.stop & ~1
+        y, u, v = planes
+        return (y[:height, start:stop],
+                u[:height // 2, start // 2:stop // 2],
+                v[:height // 2, start // 2:stop // 2])
+
+    def get_distortion_padding(self, cam_name):
+        """Return (top, bottom) distortion padding for the camera"""
+        if cam_name == 'cam0':
+            return self.left_top_padding, self.left_bottom_padding
+        return self.right_top_padding, self.right_bottom_padding
+
+    def get_distortion_map(self, cam_name, height, width):
+        """Return the cached (map_x, map_y) for a cropped image of the given size
+
+        The map covers the padded frame but map_y points into the unpadded crop, so the
+        zero padding comes from a constant border rather than a padded copy.
+        """
+        params = self.distortion_params[cam_name]
+        top_padding, bottom_padding = self.get_distortion_padding(cam_name)
+        new_height = height + top_padding + bottom_padding
+        new_ycenter = params['ycenter'] + top_padding
+        key = (new_height, width, params['xcenter'], new_ycenter, tuple(params['coeffs']))
+
+        cached = self._distortion_maps.get(cam_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        map_x, map_y = build_distortion_map(new_height, width, params['xcenter'], new_ycenter, params['coeffs'])
+        map_y -= top_padding
+        maps = (map_x, map_y)
+        self._distortion_maps[cam_name] = (key, maps)
+        return maps
+
+    def prepare_distortion_maps(self):
+        """Precompute distortion maps for the configured crop sizes"""
+        try:
+            warm_jit_kernels()
+        except Exception as e:
+            self.log_message(f"JIT warm-up failed: {e}")
+        if not self.enable_distortion_correction or not self.apply_cropping:
+            return
+        try:
+            start = time.time()
+            for cam_name in ('cam0', 'cam1'):
+                crop = self.crop_params[cam_name]
+                if self.use_fused_remap(cam_name):
+                    self.get_fused_map(cam_name, crop['height'], crop['width'])
+                else:
+                    self.get_distortion_map(cam_name, crop['height'], crop['width'])
+            self.log_message(f"✓ Distortion maps ready ({time.time() - start:.2f}s)")
+        except Exception as e:
+            self.log_message(f"Distortion map precompute failed: {e}")
 
     def apply_distortion_correction(self, image, cam_name):
         """Apply distortion correction to the image"""
         if not self.enable_distortion_correction:
             return image
-            
-        params = self.distortion_params[cam_name]
-        xcenter = params['xcenter']
-        ycenter = params['ycenter']
-        coeffs = params['coeffs']
-        
+
         try:
-            original_dtype = image.dtype
             original_height, original_width = image.shape[:2]
-            
-            if cam_name == 'cam0':
-                top_padding = self.left_top_padding
-                bottom_padding = self.left_bottom_padding
-            else:
-                top_padding = self.right_top_padding
-                bottom_padding = self.right_bottom_padding
-            
-            new_height = original_height + top_padding + bottom_padding
-            new_width = original_width
-            
-            offset_y = top_padding
-            new_xcenter = xcenter
-            new_ycenter = ycenter + offset_y
-            
-            image_float = image.astype(np.float64)
-            
-            if image_float.ndim == 2:
-                padded_image = np.zeros((new_height, new_width), dtype=np.float64)
-                padded_image[offset_y:offset_y + original_height, :] = image_float
-                corrected = post.unwarp_image_backward(padded_image, new_xcenter, new_ycenter, coeffs)
-            else:
-                padded_image = np.zeros((new_height, new_width, image_float.shape[2]), dtype=np.float64)
-                padded_image[offset_y:offset_y + original_height, :, :] = image_float
-                
-                corrected = np.zeros_like(padded_image)
-                for c in range(image_float.shape[2]):
-                    corrected[:, :, c] = post.unwarp_image_backward(padded_image[:, :, c], new_xcenter, new_ycenter, coeffs)
-            
-            corrected = np.nan_to_num(corrected, nan=0.0)
-            corrected = np.clip(corrected, 0, image.max())
-            
-            if original_dtype == np.uint8:
-                corrected = np.clip(corrected, 0, 255).astype(np.uint8)
-            elif original_dtype == np.uint16:
-                corrected = np.clip(corrected, 0, 65535).astype(np.uint16)
-            else:
-                corrected = corrected.astype(original_dtype)
+
+            map_x, map_y = self.get_distortion_map(cam_name, original_height, original_width)
+
+            # The output buffer is reused between captures
+            buffer_shape = map_x.shape + image.shape[2:]
+            corrected = self._out_buf.get(cam_name)
+            if corrected is None or corrected.shape != buffer_shape or corrected.dtype != image.dtype:
+                corrected = np.empty(buffer_shape, dtype=image.dtype)
+                self._out_buf[cam_name] = corrected
+
+            # Single multi-channel bilinear remap straight from the crop. The maps are
+            # clipped to the padded frame, so the constant border reproduces the zero
+            # padding exactly and no padded copy of the frame is needed.
+            self.remap_image(image, map_x, map_y, dst=corrected,
+                             borderMode=cv2.BORDER_CONSTANT, borderValue=0)
             
             return corrected
             
@@ -1318,119 +2047,377 @@ class UltraSafeIMX708Viewer:
             self.log_message(f"Distortion correction failed for {cam_name}: {e}")
             return image
 
+    def get_perspective_homography(self, cam_name):
+        """Return the backward perspective homography, or None when perspective correction is off"""
+        if not self.enable_perspective_correction:
+            return None
+        pers_coef = self.distortion_params.get(cam_name, {}).get('pers_coef')
+        if pers_coef is None:
+            return None
+        c1, c2, c3, c4, c5, c6, c7, c8 = pers_coef
+        # Backward-mapping homography, same model as discorpy's correct_perspective_image
+        return np.array([[c1, c2, c3], [c4, c5, c6], [c7, c8, 1.0]], dtype=np.float64)
+
     def apply_perspective_correction(self, image, cam_name):
         """Apply perspective correction if coefficients are available"""
-        if not self.enable_perspective_correction or cam_name not in self.distortion_params:
-            return image
-            
-        params = self.distortion_params[cam_name]
-        pers_coef = params.get('pers_coef')
-        
-        if pers_coef is None:
-            return image
-        
         try:
-            original_dtype = image.dtype
-            image_float = image.astype(np.float64)
-            
-            if image_float.ndim == 2:
-                corrected = post.correct_perspective_image(image_float, pers_coef)
-            else:
-                corrected = np.zeros_like(image_float)
-                for c in range(image_float.shape[2]):
-                    corrected[:, :, c] = post.correct_perspective_image(image_float[:, :, c], pers_coef)
-            
-            corrected = np.nan_to_num(corrected, nan=0.0)
-            corrected = np.clip(corrected, 0, image.max())
+            homography = self.get_perspective_homography(cam_name)
+            if homography is None:
+                return image
+            height, width = image.shape[:2]
             
-            if original_dtype == np.uint8:
-                corrected = np.clip(corrected, 0, 255).astype(np.uint8)
-            elif original_dtype == np.uint16:
-                corrected = np.clip(corrected, 0, 65535).astype(np.uint16)
-            else:
-                corrected = corrected.astype(original_dtype)
+            # Reuse the per-camera output buffer between captures
+            corrected = self._persp_out.get(cam_name)
+            if corrected is None or corrected.shape != image.shape or corrected.dtype != image.dtype:
+                corrected = np.empty_like(image)
+                self._persp_out[cam_name] = corrected
             
+            cv2.warpPerspective(image, homography, (width, height), dst=corrected,
+                                flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+                                borderMode=cv2.BORDER_REPLICATE)
             return corrected
             
         except Exception as e:
             self.log_message(f"Perspective correction failed for {cam_name}: {e}")
             return image
 
-    def rotate_left_image(self, image):
+    def get_rotation_map(self, cam_name, angle, height, width):
+        """Return cached fixed-point (map1, map2) tables rotating a frame about its centre"""
+        key = (angle, height, width)
+        cached = self._rotation_maps.get(cam_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Same transform warpAffine would apply, evaluated once per pixel up front
+        center = (width // 2, height // 2)
+        inverse = cv2.invertAffineTransform(cv2.getRotationMatrix2D(center, angle, 1.0))
+        xs = np.arange(width, dtype=np.float64)
+        ys = np.arange(height, dtype=np.float64)[:, None]
+        map_x = (inverse[0, 0] * xs + inverse[0, 1] * ys + inverse[0, 2]).astype(np.float32)
+        map_y = (inverse[1, 0] * xs + inverse[1, 1] * ys + inverse[1, 2]).astype(np.float32)
+        maps = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+        self._rotation_maps[cam_name] = (key, maps)
+        return maps
+
+    def rotate_image(self, image, cam_name, angle, dst=None):
+        """Rotate an image about its centre, skipping the resample for trivial angles
+
+        A dst view (e.g. one half of the combined image) receives the top dst.shape[0]
+        rows of the rotation; angle 0 returns the image unchanged.
+        """
+        angle = angle % 360
+        if angle == 0:
+            return image
+        if angle in RIGHT_ANGLE_ROTATIONS:
+            if dst is None:
+                return cv2.rotate(image, RIGHT_ANGLE_ROTATIONS[angle])
+            # Rotate only the source strip that lands in the kept rows
+            rows = dst.shape[0]
+            if angle == 180:
+                image = image[image.shape[0] - rows:]
+            elif angle == 90:
+                image = image[:, image.shape[1] - rows:]
+            else:
+                image = image[:, :rows]
+            return cv2.rotate(image, RIGHT_ANGLE_ROTATIONS[angle], dst=dst)
+
+        height, width = image.shape[:2]
+        map1, map2 = self.get_rotation_map(cam_name, angle, height, width)
+        return self.remap_image(image, map1, map2, dst=dst, borderMode=cv2.BORDER_REFLECT_101)
+
+    def remap_image(self, image, map1, map2, dst=None, **border):
+        """Bilinear cv2.remap, filling the top dst.shape[0] rows of dst when one is given
+
+        Runs through an OpenCL UMat when a device was found at startup; the remap tables
+        are uploaded once and stay on the device.
+        """
+        rows = map1.shape[0] if dst is None else dst.shape[0]
+        if not self.use_opencl:
+            return cv2.remap(image, map1[:rows], map2[:rows], cv2.INTER_LINEAR, dst=dst, **border)
+
+        cached = self._umat_maps.get(id(map1))
+        if cached is None or cached[0] is not map1:
+            if len(self._umat_maps) >= 4:
+                # Drop tables from old settings (two cameras x distortion/rotation)
+                self._umat_maps.clear()
+            cached = (map1, cv2.UMat(map1), cv2.UMat(map2))
+            self._umat_maps[id(map1)] = cached
+        _, umap1, umap2 = cached
+        if rows != map1.shape[0]:
+            umap1 = cv2.UMat(umap1, (0, rows), (0, map1.shape[1]))
+            umap2 = cv2.UMat(umap2, (0, rows), (0, map1.shape[1]))
+
+        result = cv2.remap(cv2.UMat(image), umap1, umap2, cv2.INTER_LINEAR, **border).get()
+        if dst is None:
+            return result
+        np.copyto(dst, result)
+        return dst
+
+    def get_rotation_setting(self, cam_name):
+        """Return (enabled, angle) of the rotation applied to this camera"""
+        if cam_name == 'cam0':
+            return self.apply_left_rotation, self.left_rotation_angle
+        return self.apply_right_rotation, self.right_rotation_angle
+
+    def use_fused_remap(self, cam_name):
+        """True when distortion, perspective and a general-angle rotation can run as a single remap"""
+        enabled, angle = self.get_rotation_setting(cam_name)
+        angle = angle % 360
+        return (self.enable_distortion_correction and enabled
+                and angle != 0 and angle not in RIGHT_ANGLE_ROTATIONS)
+
+    def get_fused_map(self, cam_name, height, width):
+        """Return cached fused distortion(+perspective)+rotation tables for a cropped image of the given size"""
+        params = self.distortion_params[cam_name]
+        top_padding, bottom_padding = self.get_distortion_padding(cam_name)
+        _, angle = self.get_rotation_setting(cam_name)
+        homography = self.get_perspective_homography(cam_name)
+        key = (height, width, top_padding, bottom_padding, params['xcenter'], params['ycenter'],
+               tuple(params['coeffs']), angle, None if homography is None else homography.tobytes())
+
+        cached = self._fused_maps.get(cam_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        maps = build_fused_rotation_map(height, width, top_padding, bottom_padding,
+                                        params['xcenter'], params['ycenter'], params['coeffs'], angle,
+                                        homography)
+        self._fused_maps[cam_name] = (key, maps)
+        return maps
+
+    def apply_fused_correction(self, image, cam_name, dst=None):
+        """Distortion-correct, perspective-correct and rotate a cropped image with one fixed-point remap"""
+        try:
+            height, width = image.shape[:2]
+            map1, map2 = self.get_fused_map(cam_name, height, width)
+            return self.remap_image(image, map1, map2, dst=dst,
+                                    borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+        except Exception as e:
+            self.log_message(f"Fused correction failed for {cam_name}, running steps separately: {e}")
+            image = self.apply_distortion_correction(image, cam_name)
+            image = self.apply_perspective_correction(image, cam_name)
+            _, angle = self.get_rotation_setting(cam_name)
+            return self.rotate_image(image, cam_name, angle)
+
+    def finish_image(self, image, cam_name, dst=None):
+        """Run the steps process_image(rotate=False) leaves out"""
+        if self.use_fused_remap(cam_name):
+            return self.apply_fused_correction(image, cam_name, dst)
+        if cam_name == 'cam0':
+            return self.rotate_left_image(image, dst)
+        return self.rotate_right_image(image, dst)
+
+    def final_shape(self, image, cam_name):
+        """Return the shape finish_image will produce for this camera"""
+        if self.use_fused_remap(cam_name):
+            top_padding, bottom_padding = self.get_distortion_padding(cam_name)
+            return (image.shape[0] + top_padding + bottom_padding,) + image.shape[1:]
+        enabled, angle = self.get_rotation_setting(cam_name)
+        if enabled and angle % 360 in (90, 270):
+            return (image.shape[1], image.shape[0]) + image.shape[2:]
+        return image.shape
+
+    def rotate_left_image(self, image, dst=None):
         """Rotate the left image by the specified angle"""
         if not self.apply_left_rotation:
             return image
             
         try:
-            import cv2
-            height, width = image.shape[:2]
-            center = (width // 2, height // 2)
-            rotation_matrix = cv2.getRotationMatrix2D(center, self.left_rotation_angle, 1.0)
-            
-            rotated = cv2.warpAffine(image, rotation_matrix, (width, height), 
-                                   flags=cv2.INTER_LINEAR, 
-                                   borderMode=cv2.BORDER_REFLECT_101)
-            return rotated
+            return self.rotate_image(image, 'cam0', self.left_rotation_angle, dst)
             
         except Exception as e:
             self.log_message(f"Left image rotation failed: {e}")
             return image
 
-    def rotate_right_image(self, image):
+    def rotate_right_image(self, image, dst=None):
         """Rotate the right image by the specified angle"""
         if not self.apply_right_rotation:
             return image
             
         try:
-            import cv2
-            height, width = image.shape[:2]
-            center = (width // 2, height // 2)
-            rotation_matrix = cv2.getRotationMatrix2D(center, self.right_rotation_angle, 1.0)
-            
-            rotated = cv2.warpAffine(image, rotation_matrix, (width, height), 
-                                   flags=cv2.INTER_LINEAR, 
-                                   borderMode=cv2.BORDER_REFLECT_101)
-            return rotated
+            return self.rotate_image(image, 'cam1', self.right_rotation_angle, dst)
             
         except Exception as e:
             self.log_message(f"Right image rotation failed: {e}")
             return image
 
+    def get_combined_buffer(self, shape, dtype):
+        """Return the side-by-side buffer, reallocating on shape change or while a write is pending"""
+        buf = self._combined_buf
+        # Queued TIFFs reference the buffer until written, so never overwrite it under them
+        if (buf is None or buf.shape != shape or buf.dtype != dtype
+                or self.tiff_queue.unfinished_tasks):
+            buf = np.empty(shape, dtype=dtype)
+            self._combined_buf = buf
+        return buf
+
     def create_combined_image(self, left_image, right_image):
-        """Create a side-by-side combined image"""
+        """Create a side-by-side combined image
+
+        The result always lives in the buffer from get_combined_buffer, which is not reused
+        while a queued TIFF still references it. A lone camera's image is copied there too:
+        it may be a reused per-camera correction buffer that the next capture overwrites.
+        """
         try:
             if left_image is None and right_image is None:
                 return None
-            elif left_image is None:
-                return right_image
-            elif right_image is None:
-                return left_image
+            elif left_image is None or right_image is None:
+                image = right_image if left_image is None else left_image
+                combined = self.get_combined_buffer(image.shape, image.dtype)
+                np.copyto(combined, image)
+                return combined
             else:
                 min_height = min(left_image.shape[0], right_image.shape[0])
                 left_resized = left_image[:min_height, :]
                 right_resized = right_image[:min_height, :]
                 
-                combined = np.hstack((left_resized, right_resized))
+                left_width = left_resized.shape[1]
+                shape = (min_height, left_width + right_resized.shape[1]) + left_resized.shape[2:]
+                combined = self.get_combined_buffer(shape, np.result_type(left_resized, right_resized))
+                np.copyto(combined[:, :left_width], left_resized)
+                np.copyto(combined[:, left_width:], right_resized)
                 return combined
         except Exception as e:
             self.log_message(f"Failed to create combined image: {e}")
             return None
 
-    def save_processed_image_tiff(self, image, output_path):
-        """Save processed image as TIFF"""
+    def create_rotated_combined_image(self, left_image, right_image):
+        """Rotate both images directly into the halves of one side-by-side buffer"""
+        if left_image is None or right_image is None or left_image.dtype != right_image.dtype:
+            return self.create_combined_image(
+                self.finish_image(left_image, 'cam0') if left_image is not None else None,
+                self.finish_image(right_image, 'cam1') if right_image is not None else None)
+
+        try:
+            left_shape = self.final_shape(left_image, 'cam0')
+            right_shape = self.final_shape(right_image, 'cam1')
+            if left_shape[2:] != right_shape[2:]:
+                return self.create_combined_image(self.finish_image(left_image, 'cam0'),
+                                                  self.finish_image(right_image, 'cam1'))
+
+            min_height = min(left_shape[0], right_shape[0])
+            left_width = left_shape[1]
+            combined = self.get_combined_buffer((min_height, left_width + right_shape[1]) + left_shape[2:],
+                                                left_image.dtype)
+            halves = (combined[:, :left_width], combined[:, left_width:])
+
+            def fill(image, cam_name, dst):
+                result = self.finish_image(image, cam_name, dst)
+                if result is not dst:
+                    # Rotation skipped (or right-angle copy): place the rows we keep
+                    np.copyto(dst, result[:dst.shape[0]])
+
+            futures = [self.process_executor.submit(fill, left_image, 'cam0', halves[0]),
+                       self.process_executor.submit(fill, right_image, 'cam1', halves[1])]
+            for future in futures:
+                future.result()
+            self.log_message("  ✓ Rotation applied into combined image")
+            return combined
+        except Exception as e:
+            self.log_message(f"Failed to create combined image: {e}")
+            return None
+
+    def update_preview_grayscale(self):
+        """Switch the live preview between colour and luma only"""
+        self.preview_grayscale = self.preview_gray_var.get()
+        self.log_message(f"Grayscale preview: {'ON' if self.preview_grayscale else 'OFF'}")
+
+    def update_burst_setting(self):
+        """Update burst mode; turning it off finishes the current multi-page file"""
+        if self.burst_var.get():
+            self.log_message("Burst mode enabled: next saves append to one multi-page TIFF")
+        else:
+            self.stop_burst()
+            self.log_message("Burst mode disabled")
+
+    def start_burst(self, path):
+        """Direct the following burst saves to a new multi-page TIFF"""
+        self.burst_path = path
+        self.log_message(f"📚 Burst file: {path}")
+
+    def stop_burst(self):
+        """Close the current burst file once its queued pages are written"""
+        if self.burst_path is not None:
+            self.burst_path = None
+            self.tiff_queue.put(None)
+
+    def _tiff_writer_loop(self):
+        """Write queued TIFFs so the save worker never waits on disk
+
+        Items are (path, image, compression, burst); burst pages are appended to one open
+        TiffWriter until a None item (or a different burst path) closes it.
+        """
+        writer = None
+        writer_path = None
+        pages = 0
+        while True:
+            item = self.tiff_queue.get()
+            try:
+                if item is None or (item[3] and item[0] != writer_path):
+                    if writer is not None:
+                        writer.close()
+                        self.log_message(f"✓ Saved: {writer_path} ({pages} pages)")
+                        writer = writer_path = None
+                    if item is None:
+                        continue
+
+                tiff_path, image, compression, burst = item
+                if burst:
+                    if writer is None:
+                        writer = tifffile.TiffWriter(tiff_path, bigtiff=True)
+                        writer_path = tiff_path
+                        pages = 0
+                    writer.write(image, **self.tiff_write_options(image, compression))
+                    pages += 1
+                    self.log_message(f"✓ Appended page {pages} to {os.path.basename(tiff_path)}")
+                elif self.save_processed_image_tiff(image, tiff_path, compression):
+                    self.log_message(f"✓ Saved: {tiff_path}")
+                else:
+                    self.log_message(f"❌ TIFF save failed: {tiff_path}")
+            except Exception as e:
+                self.log_message(f"❌ TIFF writer error: {e}")
+            finally:
+                self.tiff_queue.task_done()
+
+    def tiff_write_options(self, image, compression):
+        """Return tifffile keyword arguments for writing image with the given compression"""
+        photometric = 'rgb' if image.ndim == 3 and image.shape[2] in (3, 4) else 'minisblack'
+        # tifffile only encodes LZ4 and LZW through imagecodecs
+        if compression in ('lz4', 'lzw') and not IMAGECODECS_AVAILABLE:
+            compression = 'zlib'
+        # Horizontal differencing makes neighbouring camera pixels compress far better
+        codec = {} if compression in (None, 'none') else {'compression': compression, 'predictor': True}
+        return dict(photometric=photometric, planarconfig='contig' if photometric == 'rgb' else None,
+                    metadata=None, **codec)
+
+    def save_processed_image_tiff(self, image, output_path, compression="none"):
+        """Save processed image as TIFF (compression: none, lz4, zlib or lzw)"""
         try:
             if image is None or image.size == 0:
                 return False
             
-            imageio.imsave(output_path, image)
+            if TIFFFILE_AVAILABLE:
+                # Contiguous strips, single IFD, no JSON shape description
+                image = np.ascontiguousarray(image)
+                # Large write buffer so the strips go out in few big syscalls
+                with open(output_path, 'wb', buffering=1 << 20) as fh:
+                    tifffile.imwrite(fh, image, bigtiff=False, **self.tiff_write_options(image, compression))
+            else:
+                imageio.imsave(output_path, image)
             return True
             
         except Exception as e:
             self.log_message(f"Failed to save TIFF {output_path}: {e}")
             return False
 
+    def update_params_str(self):
+        """Rebuild the parameter suffix used in saved filenames"""
+        self._params_str = "_".join(f"{p}{v['value']:.2f}" for p, v in self.params.items())
+
     def apply_settings(self):
         """Apply camera settings safely"""
+        self.update_params_str()
         settings = {
             "ExposureTime": int(self.params['ExposureTime']['value']),
             "AnalogueGain": self.params['AnalogueGain']['value'],
@@ -1440,24 +2427,52 @@ class UltraSafeIMX708Viewer:
             "Sharpness": self.params['Sharpness']['value']
         }
         
+        # Nothing to send if the same controls already reached the same cameras
+        settings_key = (tuple(settings.items()), bool(self.cam0_connected and self.cam0),
+                        bool(self.cam1_connected and self.cam1))
+        if settings_key == self.last_applied_settings:
+            return
+        applied = True
+        
         try:
             if self.cam0_connected and self.cam0:
-                self.safe_camera_operation(lambda cam: cam.set_controls(settings), self.cam0)
+                # safe_camera_operation returns None when the call failed or was skipped
+                if self.safe_camera_operation(lambda cam: cam.set_controls(settings) or True, self.cam0) is None:
+                    applied = False
         except Exception as e:
+            applied = False
             self.log_message(f"Failed to apply settings to camera 0: {e}")
             
         try:
             if self.cam1_connected and self.cam1:
-                self.safe_camera_operation(lambda cam: cam.set_controls(settings), self.cam1)
+                # safe_camera_operation returns None when the call failed or was skipped
+                if self.safe_camera_operation(lambda cam: cam.set_controls(settings) or True, self.cam1) is None:
+                    applied = False
         except Exception as e:
+            applied = False
             self.log_message(f"Failed to apply settings to camera 1: {e}")
+        
+        # Remember only fully applied settings so a failed attempt is retried
+        self.last_applied_settings = settings_key if applied else None
+
+    def schedule_apply_settings(self, delay_ms=80):
+        """Coalesce a burst of parameter changes into one apply_settings() call"""
+        self.update_params_str()
+        if self.apply_after_id is not None:
+            self.root.after_cancel(self.apply_after_id)
+        self.apply_after_id = self.root.after(delay_ms, self._run_scheduled_apply)
+
+    def _run_scheduled_apply(self):
+        """Apply the latest parameter values once the burst has settled"""
+        self.apply_after_id = None
+        self.apply_settings()
 
     def on_scale_change(self, param_name):
         value = float(self.scales[param_name].get())
         self.entries[param_name].delete(0, tk.END)
         self.entries[param_name].insert(0, f"{value:.2f}")
         self.params[param_name]['value'] = value
-        self.apply_settings()
+        self.schedule_apply_settings()
 
     def on_entry_change(self, param_name):
         try:
@@ -1466,7 +2481,7 @@ class UltraSafeIMX708Viewer:
             if param_range['min'] <= value <= param_range['max']:
                 self.scales[param_name].set(value)
                 self.params[param_name]['value'] = value
-                self.apply_settings()
+                self.schedule_apply_settings()
             else:
                 self.entries[param_name].delete(0, tk.END)
                 self.entries[param_name].insert(0, f"{self.scales[param_name].get():.2f}")
@@ -1480,7 +2495,7 @@ class UltraSafeIMX708Viewer:
         self.entries[param_name].delete(0, tk.END)
         self.entries[param_name].insert(0, f"{default_value:.2f}")
         self.params[param_name]['value'] = default_value
-        self.apply_settings()
+        self.schedule_apply_settings()
 
     def reset_all(self):
         for param_name in self.params:
@@ -1517,8 +2532,7 @@ class UltraSafeIMX708Viewer:
         }
         
         try:
-            with open('camera_settings.json', 'w') as f:
-                json.dump(all_settings, f, indent=4)
+            dump_json(all_settings, 'camera_settings.json')
             self.log_message("Camera parameters and processing settings saved successfully")
             
             # Also save to current day folder
@@ -1575,8 +2589,7 @@ class UltraSafeIMX708Viewer:
             }
             
             settings_path = os.path.join(day_folder, 'camera_settings_daily.json')
-            with open(settings_path, 'w') as f:
-                json.dump(all_settings, f, indent=4)
+            dump_json(all_settings, settings_path)
             
             self.log_message(f"💾 Settings saved to day folder: {os.path.basename(settings_path)}")
             return True
@@ -1599,8 +2612,7 @@ class UltraSafeIMX708Viewer:
             }
             
             coeffs_path = os.path.join(day_folder, 'distortion_coefficients_daily.json')
-            with open(coeffs_path, 'w') as f:
-                json.dump(distortion_data, f, indent=4)
+            dump_json(distortion_data, coeffs_path)
             
             self.log_message(f"💾 Distortion coefficients saved to day folder: {os.path.basename(coeffs_path)}")
             return True
@@ -1628,8 +2640,7 @@ class UltraSafeIMX708Viewer:
         """Load both camera parameters and processing settings"""
         try:
             if os.path.exists('camera_settings.json'):
-                with open('camera_settings.json', 'r') as f:
-                    all_settings = json.load(f)
+                all_settings = load_json('camera_settings.json')
                 
                 # Load camera parameters (backward compatibility)
                 if 'camera_parameters' in all_settings:
@@ -1646,6 +2657,7 @@ class UltraSafeIMX708Viewer:
                         if hasattr(self, 'entries') and param in self.entries:
                             self.entries[param].delete(0, tk.END)
                             self.entries[param].insert(0, f"{value:.2f}")
+                self.update_params_str()
                 
                 # Load processing settings
                 if 'processing_settings' in all_settings:
@@ -1666,6 +2678,7 @@ class UltraSafeIMX708Viewer:
                     # Load crop parameters
                     if 'crop_params' in proc_settings:
                         self.crop_params = proc_settings['crop_params']
+                    self.update_crop_slices()
                     
                     # Update GUI elements if they exist
                     if hasattr(self, 'cropping_var'):
@@ -1713,8 +2726,7 @@ class UltraSafeIMX708Viewer:
             
         if os.path.exists(dual_coeff_file):
             try:
-                with open(dual_coeff_file, 'r') as f:
-                    saved_params = json.load(f)
+                saved_params = load_json(dual_coeff_file)
                     
                 for cam in ['cam0', 'cam1']:
                     if cam in saved_params:
@@ -1725,6 +2737,9 @@ class UltraSafeIMX708Viewer:
                             if key in saved_params[cam]:
                                 self.distortion_params[cam][key] = saved_params[cam][key]
                 
+                # Drop sampling maps built from the previous coefficients
+                self._distortion_maps.clear()
+                
                 self.log_message(f"Loaded coefficients from {os.path.basename(dual_coeff_file)}")
                 return True
             except Exception as e:
@@ -1739,8 +2754,6 @@ class UltraSafeIMX708Viewer:
 
     def load_coefficients_dialog(self):
         """Load distortion coefficients from file dialog"""
-        from tkinter import filedialog
-        
         coeff_file = filedialog.askopenfilename(
             title="Select Distortion Coefficients JSON File",
             filetypes=[
@@ -1759,6 +2772,9 @@ class UltraSafeIMX708Viewer:
             self.log_message(f"✓ Loaded coefficients from {os.path.basename(coeff_file)}")
             messagebox.showinfo("Success", f"Distortion coefficients loaded successfully from:\n{os.path.basename(coeff_file)}")
             
+            # Rebuild the distortion maps now rather than on the next capture
+            threading.Thread(target=self.prepare_distortion_maps, daemon=True).start()
+            
             # Save updated configuration to day folder
             self.save_all_to_day_folder()
         else:
@@ -1795,7 +2811,17 @@ class UltraSafeIMX708Viewer:
         ttk.Button(info_window, text="Close", command=info_window.destroy).pack(pady=10)
 
     def generate_processing_info(self):
-        """Generate detailed processing information text"""
+        """Generate detailed processing information text (cached until the settings change)"""
+        # repr() snapshots the nested dicts, which are edited in place
+        signature = (self.apply_cropping, self.enable_distortion_correction, self.enable_perspective_correction,
+                     self.apply_left_rotation, self.apply_right_rotation,
+                     self.left_rotation_angle, self.right_rotation_angle,
+                     self.left_top_padding, self.left_bottom_padding,
+                     self.right_top_padding, self.right_bottom_padding,
+                     repr(self.crop_params), repr(self.distortion_params))
+        if self._info_cache is not None and self._info_cache[0] == signature:
+            return self._info_cache[1]
+
         info = []
         
         info.append("=== PROCESSING PIPELINE STATUS ===\n")
@@ -1872,11 +2898,14 @@ class UltraSafeIMX708Viewer:
         else:
             info.append("No processing steps enabled\n")
         
-        return "".join(info)
+        text = "".join(info)
+        self._info_cache = (signature, text)
+        return text
 
     def update_cropping_setting(self):
         """Update cropping setting"""
         self.apply_cropping = self.cropping_var.get()
+        self.update_crop_slices()
         self.log_message(f"Cropping {'enabled' if self.apply_cropping else 'disabled'}")
 
     def update_distortion_setting(self):
@@ -1899,32 +2928,38 @@ class UltraSafeIMX708Viewer:
         self.apply_right_rotation = self.right_rotation_var.get()
         self.log_message(f"Right image rotation {'enabled' if self.apply_right_rotation else 'disabled'}")
 
+    # (attribute, Tk variable) pairs read back by get_current_processing_settings
+    PROCESSING_VAR_SPEC = (
+        ('left_rotation_angle', 'left_angle_var'),
+        ('right_rotation_angle', 'right_angle_var'),
+        ('left_top_padding', 'left_top_padding_var'),
+        ('left_bottom_padding', 'left_bottom_padding_var'),
+        ('right_top_padding', 'right_top_padding_var'),
+        ('right_bottom_padding', 'right_bottom_padding_var'),
+    )
+    # (camera, crop key, Tk variable) triples for the crop parameters
+    CROP_VAR_SPEC = (
+        ('cam0', 'width', 'left_width_var'),
+        ('cam0', 'start_x', 'left_start_x_var'),
+        ('cam0', 'height', 'left_height_var'),
+        ('cam1', 'width', 'right_width_var'),
+        ('cam1', 'start_x', 'right_start_x_var'),
+        ('cam1', 'height', 'right_height_var'),
+    )
+
     def get_current_processing_settings(self):
         """Get current processing settings from GUI"""
-        # Update rotation angles from GUI
-        if hasattr(self, 'left_angle_var'):
-            self.left_rotation_angle = self.left_angle_var.get()
-        if hasattr(self, 'right_angle_var'):
-            self.right_rotation_angle = self.right_angle_var.get()
-        
-        # Update padding from GUI
-        if hasattr(self, 'left_top_padding_var'):
-            self.left_top_padding = self.left_top_padding_var.get()
-        if hasattr(self, 'left_bottom_padding_var'):
-            self.left_bottom_padding = self.left_bottom_padding_var.get()
-        if hasattr(self, 'right_top_padding_var'):
-            self.right_top_padding = self.right_top_padding_var.get()
-        if hasattr(self, 'right_bottom_padding_var'):
-            self.right_bottom_padding = self.right_bottom_padding_var.get()
-        
-        # Update crop parameters from GUI
-        if hasattr(self, 'left_width_var'):
-            self.crop_params['cam0']['width'] = self.left_width_var.get()
-            self.crop_params['cam0']['start_x'] = self.left_start_x_var.get()
-            self.crop_params['cam0']['height'] = self.left_height_var.get()
-            self.crop_params['cam1']['width'] = self.right_width_var.get()
-            self.crop_params['cam1']['start_x'] = self.right_start_x_var.get()
-            self.crop_params['cam1']['height'] = self.right_height_var.get()
+        # Variables are missing only before setup_gui has run
+        for attr, var_name in self.PROCESSING_VAR_SPEC:
+            var = getattr(self, var_name, None)
+            if var is not None:
+                setattr(self, attr, var.get())
+        
+        for cam_name, key, var_name in self.CROP_VAR_SPEC:
+            var = getattr(self, var_name, None)
+            if var is not None:
+                self.crop_params[cam_name][key] = var.get()
+        self.update_crop_slices()
 
     def detect_camera_capabilities(self, cam, cam_label):
         """Detect and log camera capabilities including autofocus support"""
@@ -2225,7 +3260,6 @@ class UltraSafeIMX708Viewer:
             })
             
             # Wait a bit and check status
-            import time
             time.sleep(0.5)
             
             # Try to read AF state if available
@@ -2288,7 +3322,6 @@ def main():
         
         # Check GUI support
         try:
-            import tkinter as tk
             root = tk.Tk()
             root.withdraw()
             root.destroy()
@@ -2305,11 +3338,9 @@ def main():
         return 0
     except Exception as e:
         print(f"Error: {str(e)}")
-        import traceback
         traceback.print_exc()
         return 1
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
\ No newline at end of file
@@ -1,7 +1,29 @@
 import os
+import hashlib
+import shutil
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, features
+
+try:
+    import cv2
+    import numpy as np
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+# Modes PhotoImage can blit without a per-frame conversion
+DISPLAY_MODES = ("L", "RGB", "RGBA")
+
+PREVIEW_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "imagecropper")
+
+def check_pillow_features():
+    """Warn when Pillow lacks libjpeg-turbo."""
+    try:
+        if not features.check_feature("libjpeg_turbo"):
+            print("⚠️ Pillow was built without libjpeg-turbo; JPEG decoding will be slower")
+    except ValueError:
+        pass
 
 class ImageCropperTool:
     def __init__(self):
@@ -17,6 +39,17 @@ class ImageCropperTool:
         self.zoom_factor = 1.0
         self.pan_x = 0
         self.pan_y = 0
+        self._last_display_wh = None
+        self._source_path = None
+        self._display_source = None
+        self._base_image = None
+        self._base_scale = 1.0
+        self._buf_wh = None
+        self._shrink_after_id = None
+        self._redraw_pending = False
+        self._rebuild_pending = False
+        self._photo_pool = {}
+        self._rect_dirty = False
         
         # UI Setup
         self.setup_ui()
@@ -32,6 +65,7 @@ class ImageCropperTool:
         tk.Button(button_frame, text="Reset Zoom", command=self.reset_zoom).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Crop & Resize", command=self.crop_and_resize).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Save Result", command=self.save_image).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Clear Preview Cache", command=self.clear_preview_cache).pack(side=tk.LEFT, padx=5)
         
         # Canvas for image display
         canvas_frame = tk.Frame(self.root)
@@ -39,6 +73,10 @@ class ImageCropperTool:
         
         self.canvas = tk.Canvas(canvas_frame, bg='gray90')
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
+        
+        # Persistent image item; redraws only change its image and position
+        self._img_item = self.canvas.create_image(0, 0, anchor='center')
         
         # Variables for cropping
         self.crop_width = 512
@@ -48,7 +86,7 @@ class ImageCropperTool:
         # Crop rectangle variables
         self.start_x = None
         self.start_y = None
-        self.rect_id = None
+        self.rect_id = self.canvas.create_rectangle(0, 0, 0, 0, outline='red', width=2, tags="crop_rect", state='hidden')
         
         # Bind mouse events for cropping and panning
         self.canvas.bind("<Button-1>", self.mouse_click)
@@ -92,13 +130,80 @@ class ImageCropperTool:
         
         if file_path:
             try:
-                self.original_image = Image.open(file_path)
+                # Header only: the full-resolution pixels are decoded on demand by _open_source_image
+                with Image.open(file_path) as header:
+                    self.original_image = header
+                self._source_path = file_path
+                self._display_source = self.load_display_source(file_path)
+                self._base_image = None
+                self._last_display_wh = None
                 self.display_image_on_canvas()
                 self.update_status()
                 self.status_label.config(text=f"Loaded: {os.path.basename(file_path)} ({self.original_image.size[0]}x{self.original_image.size[1]}) | " + self.status_label.cget("text"))
             except Exception as e:
                 messagebox.showerror("Error", f"Could not open image: {str(e)}")
     
+    def _preview_cache_path(self, file_path):
+        stat = os.stat(file_path)
+        key = hashlib.sha1(f"{os.path.abspath(file_path)}{stat.st_mtime}{stat.st_size}".encode()).hexdigest()
+        return os.path.join(PREVIEW_CACHE_DIR, f"{key}.jpg")
+        
+    def _open_source_image(self, size=None):
+        """Decode the full image afresh (draft-reduced towards size for JPEGs); the caller drops it after use."""
+        if self._source_path is None:
+            return self.original_image
+        with Image.open(self._source_path) as image:
+            if size and image.format == "JPEG":
+                image.draft("RGB", size)
+            image.load()
+        # Normalise CMYK/palette/etc. so PhotoImage never converts per redraw
+        if image.mode not in DISPLAY_MODES:
+            image = image.convert('RGB')
+        return image
+        
+    def load_display_source(self, file_path):
+        """Decode a reduced copy of the image for display, using JPEG draft mode and a disk cache."""
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        if canvas_width <= 1 or canvas_height <= 1:
+            canvas_width, canvas_height = 800, 600
+        preview_size = (canvas_width * 2, canvas_height * 2)
+        
+        cache_path = self._preview_cache_path(file_path)
+        if os.path.exists(cache_path):
+            try:
+                with Image.open(cache_path) as cached:
+                    # A preview cached from a smaller window would have to be upscaled; rebuild it
+                    if cached.size[0] >= preview_size[0] - 1 or cached.size[1] >= preview_size[1] - 1:
+                        cached.load()
+                        return cached
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable preview cache {cache_path}: {e}")
+        
+        display_img = Image.open(file_path)
+        full_size = display_img.size
+        if display_img.format == "JPEG":
+            # libjpeg scales by 1/2, 1/4 or 1/8 during the IDCT, never below the requested size
+            display_img.draft("RGB", preview_size)
+        display_img.load()
+        if display_img.mode not in DISPLAY_MODES:
+            display_img = display_img.convert('RGB')
+        
+        # Only images larger than the preview are worth caching
+        if full_size[0] > preview_size[0] or full_size[1] > preview_size[1]:
+            display_img.thumbnail(preview_size, Image.Resampling.BILINEAR)
+            if display_img.mode != "RGBA":
+                try:
+                    os.makedirs(PREVIEW_CACHE_DIR, exist_ok=True)
+                    display_img.save(cache_path, "JPEG", quality=85)
+                except OSError as e:
+                    print(f"⚠️ Could not write preview cache: {e}")
+        return display_img
+        
+    def clear_preview_cache(self):
+        shutil.rmtree(PREVIEW_CACHE_DIR, ignore_errors=True)
+        self.status_label.config(text="Preview cache cleared")
+        
     def display_image_on_canvas(self):
         if not self.original_image:
             return
@@ -111,6 +216,26 @@ class ImageCropperTool:
             self.root.after(100, self.display_image_on_canvas)
             return
             
+        self._rebuild_display_image(canvas_width, canvas_height)
+        self._redraw_canvas()
+        
+    def _schedule_redraw(self, rebuild=True):
+        """Coalesce bursts of zoom/pan events into a single idle redraw."""
+        self._rebuild_pending = self._rebuild_pending or rebuild
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+        
+    def _do_redraw(self):
+        self._redraw_pending = False
+        if self._rebuild_pending:
+            self._rebuild_pending = False
+            self.display_image_on_canvas()
+        else:
+            self._redraw_canvas()
+        
+    def _rebuild_display_image(self, canvas_width, canvas_height):
+        """Resize the image for display, only when the displayed size has changed."""
         img_width, img_height = self.original_image.size
         
         # Base scale to fit canvas
@@ -121,16 +246,96 @@ class ImageCropperTool:
         # Apply zoom factor
         self.scale_factor = base_scale * self.zoom_factor
         
-        # Resize image for display
-        display_width = int(img_width * self.scale_factor)
-        display_height = int(img_height * self.scale_factor)
+        # Resize image for display, unless the displayed size is unchanged
+        display_width = max(1, int(img_width * self.scale_factor))
+        display_height = max(1, int(img_height * self.scale_factor))
+        if (display_width, display_height) == self._last_display_wh:
+            return
+        self._last_display_wh = (display_width, display_height)
+        
+        # Canvas-fit copy built once per image, so zooming out never touches the original.
+        # It is fitted to the canvas padded up to 256 px, so small window resizes still fit.
+        needed = self._padded_canvas_size(canvas_width, canvas_height)
+        if self._base_image is None or needed[0] > self._buf_wh[0] or needed[1] > self._buf_wh[1]:
+            buf_scale = min(needed[0] / img_width, needed[1] / img_height, 1.0)
+            base_size = (max(1, int(img_width * buf_scale)), max(1, int(img_height * buf_scale)))
+            base_source = self._display_source
+            if base_source.size[0] < base_size[0] or base_source.size[1] < base_size[1]:
+                # Window grew past the reduced preview: resample from the source, never upscale
+                base_source = self._open_source_image(base_size)
+            if base_source.size == base_size:
+                # e.g. a crop_and_resize result smaller than the canvas: nothing to resample
+                self._base_image = base_source
+            else:
+                self._base_image = base_source.resize(base_size, Image.Resampling.BILINEAR)
+            self._base_scale = buf_scale
+            self._buf_wh = needed
+        
+        # Use the smallest cached copy that still has at least display resolution
+        for source in (self._base_image, self._display_source):
+            if source is not None and display_width <= source.size[0] and display_height <= source.size[1]:
+                break
+        else:
+            # Zoomed past the cached copies: decode just enough of the source and let it go afterwards
+            source = self._open_source_image((display_width, display_height))
+        
+        # Cheap filters are fine on screen; crop_and_resize never resamples the output
+        factor = source.size[0] // display_width
+        if source.size == (display_width, display_height):
+            self.display_image = source
+        elif factor > 1 and source.size == (display_width * factor, display_height * factor):
+            # Exact integer shrink: box-average with reduce() instead of a resampling filter
+            self.display_image = source.reduce(factor)
+        elif display_width < source.size[0] * 0.5:
+            self.display_image = source.resize((display_width, display_height), Image.Resampling.NEAREST)
+        elif CV2_AVAILABLE and source.mode in ("L", "RGB", "RGBA") and display_width < source.size[0]:
+            # OpenCV's SIMD area averaging beats Pillow's BILINEAR for moderate shrinks
+            resized = cv2.resize(np.asarray(source), (display_width, display_height), interpolation=cv2.INTER_AREA)
+            self.display_image = Image.fromarray(resized, source.mode)
+        else:
+            self.display_image = source.resize((display_width, display_height), Image.Resampling.BILINEAR)
+        self.photo = self._get_photo(self.display_image)
+        self.canvas.itemconfig(self._img_item, image=self.photo)
         
-        self.display_image = self.original_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-        self.photo = ImageTk.PhotoImage(self.display_image)
+    @staticmethod
+    def _padded_canvas_size(canvas_width, canvas_height):
+        return ((canvas_width + 255) // 256 * 256, (canvas_height + 255) // 256 * 256)
         
-        # Clear canvas and display image with pan offset
-        self.canvas.delete("all")
-        self.canvas.create_image(canvas_width//2 + self.pan_x, canvas_height//2 + self.pan_y, image=self.photo)
+    def on_canvas_resize(self, event):
+        """Refit the image to a resized window, dropping an oversized base buffer once resizing stops."""
+        if not self.original_image:
+            return
+        self._schedule_redraw()
+        if self._shrink_after_id:
+            self.root.after_cancel(self._shrink_after_id)
+        self._shrink_after_id = self.root.after(2000, self._shrink_buffer)
+        
+    def _shrink_buffer(self):
+        self._shrink_after_id = None
+        if self._buf_wh and self._padded_canvas_size(self.canvas.winfo_width(), self.canvas.winfo_height()) != self._buf_wh:
+            # Rebuilt at the current padded size on the next redraw
+            self._base_image = None
+            self._last_display_wh = None
+            self._schedule_redraw()
+        
+    def _get_photo(self, image):
+        """Paste into a pooled PhotoImage of the same size instead of allocating a new one."""
+        key = (image.mode, image.size)
+        photo = self._photo_pool.get(key)
+        if photo is None:
+            if len(self._photo_pool) >= 4:
+                self._photo_pool.clear()
+            photo = ImageTk.PhotoImage(image)
+            self._photo_pool[key] = photo
+        else:
+            photo.paste(image)
+        return photo
+        
+    def _redraw_canvas(self):
+        """Move the existing image item to the current pan offset."""
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        self.canvas.coords(self._img_item, canvas_width//2 + self.pan_x, canvas_height//2 + self.pan_y)
         
         # Redraw crop rectangle if it exists
         if hasattr(self, 'rect_id') and self.rect_id and self.start_x is not None:
@@ -174,7 +379,7 @@ class ImageCropperTool:
         self.zoom_factor *= zoom_factor
         self.zoom_factor = max(0.1, min(10.0, self.zoom_factor))  # Limit zoom range
         
-        self.display_image_on_canvas()
+        self._schedule_redraw()
         self.update_status()
     
     def start_pan(self, event):
@@ -195,7 +400,8 @@ class ImageCropperTool:
         self.last_x = event.x
         self.last_y = event.y
         
-        self.display_image_on_canvas()
+        # Panning never changes the scale, so just move the existing item
+        self._schedule_redraw(rebuild=False)
     
     def ctrl_pressed(self, event):
         if not self.is_panning and not self.is_cropping:
@@ -215,68 +421,68 @@ class ImageCropperTool:
         if key == 'plus' or key == 'equal':
             self.zoom_factor *= 1.1
             self.zoom_factor = min(10.0, self.zoom_factor)
-            self.display_image_on_canvas()
+            self._schedule_redraw()
             self.update_status()
         elif key == 'minus':
             self.zoom_factor *= 0.9
             self.zoom_factor = max(0.1, self.zoom_factor)
-            self.display_image_on_canvas()
+            self._schedule_redraw()
             self.update_status()
         
         # Resize crop with parentheses
         elif key == 'parenleft':  # ( key - make crop smaller
             self.crop_width = max(10, self.crop_width - 10)
             self.crop_height = max(10, self.crop_height - 10)
-            if hasattr(self, 'rect_id') and self.rect_id:
-                self.update_crop_display()
+            self._schedule_rect()
             self.update_status()
         elif key == 'parenright':  # ) key - make crop larger
             self.crop_width += 10
             self.crop_height += 10
-            if hasattr(self, 'rect_id') and self.rect_id:
-                self.update_crop_display()
+            self._schedule_rect()
             self.update_status()
         
         # Arrow keys for fine crop resizing
         elif key == 'Up':
             self.crop_height = max(10, self.crop_height - 5)
-            if hasattr(self, 'rect_id') and self.rect_id:
-                self.update_crop_display()
+            self._schedule_rect()
             self.update_status()
         elif key == 'Down':
             self.crop_height += 5
-            if hasattr(self, 'rect_id') and self.rect_id:
-                self.update_crop_display()
+            self._schedule_rect()
             self.update_status()
         elif key == 'Left':
             self.crop_width = max(10, self.crop_width - 5)
-            if hasattr(self, 'rect_id') and self.rect_id:
-                self.update_crop_display()
+            self._schedule_rect()
             self.update_status()
         elif key == 'Right':
             self.crop_width += 5
-            if hasattr(self, 'rect_id') and self.rect_id:
-                self.update_crop_display()
+            self._schedule_rect()
             self.update_status()
     
+    def _schedule_rect(self):
+        """Coalesce key-repeat and drag updates of the crop rectangle into one idle move."""
+        if not self._rect_dirty:
+            self._rect_dirty = True
+            self.root.after_idle(self._flush_rect)
+        
+    def _flush_rect(self):
+        self._rect_dirty = False
+        self.update_crop_display()
+        
     def update_crop_display(self):
         if not self.original_image or self.start_x is None or self.start_y is None:
             return
             
-        # Delete old rectangle
-        if self.rect_id:
-            self.canvas.delete(self.rect_id)
-            
         # Calculate rectangle size based on current crop dimensions and zoom
         crop_w_scaled = self.crop_width * self.scale_factor
         crop_h_scaled = self.crop_height * self.scale_factor
         
-        # Draw new rectangle
-        self.rect_id = self.canvas.create_rectangle(
-            self.start_x, self.start_y, 
-            self.start_x + crop_w_scaled, self.start_y + crop_h_scaled,
-            outline='red', width=2, tags="crop_rect"
+        # Move the existing rectangle
+        self.canvas.coords(
+            self.rect_id, self.start_x, self.start_y, 
+            self.start_x + crop_w_scaled, self.start_y + crop_h_scaled
         )
+        self.canvas.itemconfig(self.rect_id, state='normal')
     
     def mouse_click(self, event):
         if not self.original_image:
@@ -326,10 +532,6 @@ class ImageCropperTool:
         self.start_x = max(0, min(self.start_x, canvas_width - crop_w_scaled))
         self.start_y = max(0, min(self.start_y, canvas_height - crop_h_scaled))
         
-        # Delete existing rectangle
-        if self.rect_id:
-            self.canvas.delete(self.rect_id)
-            
         # Draw initial rectangle
         self.update_crop_display()
     
@@ -353,14 +555,18 @@ class ImageCropperTool:
         self.start_x = max(0, min(self.start_x, canvas_width - crop_w_scaled))
         self.start_y = max(0, min(self.start_y, canvas_height - crop_h_scaled))
         
-        # Update the display
-        self.update_crop_display()
+        # Update the display once the pending drag events are handled
+        self._schedule_rect()
     
     def crop_and_resize(self):
         if not self.original_image or self.start_x is None:
             messagebox.showwarning("Warning", "Please select a crop area first by clicking on the image.")
             return
             
+        # Make sure scale_factor and pan reflect any redraw still waiting for idle
+        if self._redraw_pending:
+            self._do_redraw()
+            
         try:
             # Convert canvas coordinates to image coordinates with zoom and pan
             canvas_width = self.canvas.winfo_width()
@@ -387,19 +593,29 @@ class ImageCropperTool:
             actual_crop_width = min(self.crop_width, img_width - crop_x)
             actual_crop_height = min(self.crop_height, img_height - crop_y)
             
-            # Crop the image
-            crop_box = (crop_x, crop_y, crop_x + actual_crop_width, crop_y + actual_crop_height)
-            cropped_image = self.original_image.crop(crop_box)
-            
-            # Create target size image with white background
-            result_image = Image.new('RGB', self.target_size, 'white')
-            
             # Calculate position to center the cropped image
             paste_x = (self.target_size[0] - actual_crop_width) // 2
             paste_y = (self.target_size[1] - actual_crop_height) // 2
             
-            # Paste the cropped image onto the white background
-            result_image.paste(cropped_image, (paste_x, paste_y))
+            # A crop larger than the target loses its edges in the paste, so only crop what survives
+            skip_x = max(0, -paste_x)
+            skip_y = max(0, -paste_y)
+            visible_width = min(actual_crop_width, self.target_size[0])
+            visible_height = min(actual_crop_height, self.target_size[1])
+            
+            # Crop the image
+            crop_box = (crop_x + skip_x, crop_y + skip_y, crop_x + skip_x + visible_width, crop_y + skip_y + visible_height)
+            cropped_image = self._open_source_image().crop(crop_box)
+            
+            if cropped_image.size == self.target_size:
+                # The crop covers the whole target, so no white border would show
+                result_image = cropped_image if cropped_image.mode == 'RGB' else cropped_image.convert('RGB')
+            else:
+                # Create target size image with white background
+                result_image = Image.new('RGB', self.target_size, 'white')
+                
+                # Paste the cropped image onto the white background
+                result_image.paste(cropped_image, (paste_x + skip_x, paste_y + skip_y))
             
             # Store result
             self.result_image = result_image
@@ -411,6 +627,10 @@ class ImageCropperTool:
             
             # Update display to show result
             self.original_image = result_image
+            self._source_path = None
+            self._display_source = result_image
+            self._base_image = None
+            self._last_display_wh = None
             self.display_image_on_canvas()
             
             self.status_label.config(text=f"Cropped and resized! Final size: {self.target_size[0]}x{self.target_size[1]}")
@@ -452,5 +672,6 @@ class ImageCropperTool:
         self.root.mainloop()
 
 if __name__ == "__main__":
+    check_pillow_features()
     app = ImageCropperTool()
     app.run() 
\ No newline at end of file
@@ -70,6 +70,7 @@ class DualImagePostProcessor:
         self.enable_perspective_correction = True  # New perspective correction flag
         self.apply_left_rotation = True  # New flag for left image rotation
         self.left_rotation_angle = -1.5  # Rotation angle in degrees
+        self._rotation_matrix = None  # ((angle, width, height), matrix) of the last rotation
         self.jpeg_quality = 95
         self.output_format = 'JPEG'  # 'JPEG', 'TIFF', 'PNG'
         self.save_combined = True  # Save side-by-side combined image
@@ -155,6 +156,20 @@ class DualImagePostProcessor:
         print(f"[INFO] Cropped {cam_name}: {image.shape} -> {cropped.shape}")
         return cropped
 
+    def finalize_corrected(self, corrected, original_dtype):
+        """Clean up a float correction result in place and cast it back to the input dtype"""
+        # Clamp to the dtype ceiling rather than scanning the input for its max
+        if np.issubdtype(original_dtype, np.integer):
+            upper = np.iinfo(original_dtype).max
+        else:
+            upper = 1.0
+        
+        # Handle potential NaN or infinite values without allocating a copy
+        np.nan_to_num(corrected, copy=False, nan=0.0, posinf=upper, neginf=0.0)
+        np.clip(corrected, 0, upper, out=corrected)
+        
+        return corrected.astype(original_dtype, copy=False)
+
     def apply_distortion_correction(self, image, cam_name):
         """Apply distortion correction to the image"""
         if not self.enable_distortion_correction or cam_name not in self.distortion_params:
@@ -166,10 +181,8 @@ class DualImagePostProcessor:
         coeffs = params['coeffs']
         
         try:
-            # Store original data type and range
+            # Store original data type
             original_dtype = image.dtype
-            original_min = image.min()
-            original_max = image.max()
             
             # Convert to float for processing
             if image.dtype != np.float64:
@@ -186,23 +199,11 @@ class DualImagePostProcessor:
                 for c in range(image_float.shape[2]):
                     corrected[:, :, c] = post.unwarp_image_backward(image_float[:, :, c], xcenter, ycenter, coeffs)
             
-            # Handle potential NaN or infinite values
-            corrected = np.nan_to_num(corrected, nan=0.0, posinf=original_max, neginf=0.0)
-            
-            # Clip to reasonable range
-            corrected = np.clip(corrected, 0, original_max)
-            
-            # Convert back to original data type
-            if original_dtype == np.uint8:
-                corrected = np.clip(corrected, 0, 255).astype(np.uint8)
-            elif original_dtype == np.uint16:
-                corrected = np.clip(corrected, 0, 65535).astype(np.uint16)
-            else:
-                corrected = corrected.astype(original_dtype)
+            # Clean up NaN/inf, clip and convert back to original data type
+            corrected = self.finalize_corrected(corrected, original_dtype)
             
             print(f"[INFO] Applied distortion correction to {cam_name}")
             print(f"   Center: ({xcenter:.1f}, {ycenter:.1f})")
-            print(f"   Input range: [{original_min}, {original_max}], Output range: [{corrected.min()}, {corrected.max()}]")
             
             return corrected
             
@@ -223,10 +224,8 @@ class DualImagePostProcessor:
             return image
         
         try:
-            # Store original data type and range
+            # Store original data type
             original_dtype = image.dtype
-            original_min = image.min()
-            original_max = image.max()
             
             # Convert to float for processing
             if image.dtype != np.float64:
@@ -243,22 +242,10 @@ class DualImagePostProcessor:
                 for c in range(image_float.shape[2]):
                     corrected[:, :, c] = post.correct_perspective_image(image_float[:, :, c], pers_coef)
             
-            # Handle potential NaN or infinite values
-            corrected = np.nan_to_num(corrected, nan=0.0, posinf=original_max, neginf=0.0)
-            
-            # Clip to reasonable range
-            corrected = np.clip(corrected, 0, original_max)
-            
-            # Convert back to original data type
-            if original_dtype == np.uint8:
-                corrected = np.clip(corrected, 0, 255).astype(np.uint8)
-            elif original_dtype == np.uint16:
-                corrected = np.clip(corrected, 0, 65535).astype(np.uint16)
-            else:
-                corrected = corrected.astype(original_dtype)
+            # Clean up NaN/inf, clip and convert back to original data type
+            corrected = self.finalize_corrected(corrected, original_dtype)
             
             print(f"[INFO] Applied perspective correction to {cam_name}")
-            print(f"   Input range: [{original_min}, {original_max}], Output range: [{corrected.min()}, {corrected.max()}]")
             
             return corrected
             
@@ -275,9 +262,12 @@ class DualImagePostProcessor:
             # Get image dimensions
             height, width = image.shape[:2]
             
-            # Calculate rotation matrix
-            center = (width // 2, height // 2)
-            rotation_matrix = cv2.getRotationMatrix2D(center, self.left_rotation_angle, 1.0)
+            # Rotation matrix, reused across a batch of same-sized images
+            key = (self.left_rotation_angle, width, height)
+            if self._rotation_matrix is None or self._rotation_matrix[0] != key:
+                center = (width // 2, height // 2)
+                self._rotation_matrix = (key, cv2.getRotationMatrix2D(center, self.left_rotation_angle, 1.0))
+            rotation_matrix = self._rotation_matrix[1]
             
             # Apply rotation
             rotated = cv2.warpAffine(image, rotation_matrix, (width, height), 